@@ -14,7 +14,7 @@ def gzip(data: str | bytes) -> bytes:
         raise Exception(f"Data is not str or bytes: {str(data)}")
 
     try:
-        gzipped_data = gzip_lib.compress(data, compresslevel=9)
+        gzipped_data = gzip_lib.compress(data, compresslevel=1, mtime=0)
     except Exception as ex:
         raise Exception(f"Unable to gzip data: {str(ex)}")
 
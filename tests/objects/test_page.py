@@ -0,0 +1,52 @@
+import datetime
+
+from usp.objects.page import (
+    SitemapNewsStory,
+    SitemapPage,
+    SitemapPageChangeFrequency,
+)
+
+PUBLISH_DATE = datetime.datetime(2009, 12, 17, 12, 4, 56)
+
+
+def test_news_story_hash():
+    story = SitemapNewsStory(
+        title="Foo",
+        publish_date=PUBLISH_DATE,
+        genres=["PressRelease", "Blog"],
+        keywords=["foo", "bar"],
+        stock_tickers=["NASDAQ:A"],
+    )
+    same_story = SitemapNewsStory(
+        title="Foo",
+        publish_date=PUBLISH_DATE,
+        genres=["PressRelease", "Blog"],
+        keywords=["foo", "bar"],
+        stock_tickers=["NASDAQ:A"],
+    )
+
+    assert story == same_story
+    assert hash(story) == hash(same_story)
+    assert len({story, same_story}) == 1
+
+
+def test_page_eq_same_instance():
+    page = SitemapPage(
+        url="http://www.example.com/foo.html",
+        news_story=SitemapNewsStory(title="Foo", publish_date=PUBLISH_DATE),
+    )
+
+    assert page == page
+    assert page == SitemapPage(
+        url="http://www.example.com/foo.html",
+        news_story=SitemapNewsStory(title="Foo", publish_date=PUBLISH_DATE),
+    )
+    assert page != SitemapPage(url="http://www.example.com/bar.html")
+
+
+def test_change_frequency_has_value():
+    for change_frequency in SitemapPageChangeFrequency:
+        assert SitemapPageChangeFrequency.has_value(change_frequency.value)
+
+    assert not SitemapPageChangeFrequency.has_value("when we feel like it")
+    assert not SitemapPageChangeFrequency.has_value("DAILY")
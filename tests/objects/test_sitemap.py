@@ -0,0 +1,33 @@
+import pytest
+
+from usp.objects.page import SitemapPage
+from usp.objects.sitemap import (
+    IndexRobotsTxtSitemap,
+    IndexWebsiteSitemap,
+    IndexXMLSitemap,
+    PagesAtomSitemap,
+    PagesRSSSitemap,
+    PagesTextSitemap,
+    PagesXMLSitemap,
+)
+
+URL = "http://www.example.com/sitemap.xml"
+
+
+@pytest.mark.parametrize(
+    "sitemap_cls",
+    [PagesXMLSitemap, PagesTextSitemap, PagesRSSSitemap, PagesAtomSitemap],
+)
+def test_pages_sitemap_slots(sitemap_cls):
+    sitemap = sitemap_cls(
+        url=URL, pages=[SitemapPage(url="http://www.example.com/foo.html")]
+    )
+    assert not hasattr(sitemap, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "sitemap_cls", [IndexWebsiteSitemap, IndexXMLSitemap, IndexRobotsTxtSitemap]
+)
+def test_index_sitemap_slots(sitemap_cls):
+    sitemap = sitemap_cls(url=URL, sub_sitemaps=[])
+    assert not hasattr(sitemap, "__dict__")
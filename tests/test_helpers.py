@@ -1,5 +1,6 @@
 import datetime
 import logging
+from collections.abc import Iterator
 
 import pytest
 
@@ -17,10 +18,12 @@ from usp.helpers import (
     parse_iso8601_date,
     parse_rfc2822_date,
     strip_url_to_homepage,
+    ungzipped_response_chunks,
 )
 from usp.web_client.abstract_client import (
     AbstractWebClient,
     AbstractWebClientResponse,
+    AbstractWebClientSuccessResponse,
     WebClientErrorResponse,
 )
 
@@ -87,6 +90,12 @@ def test_parse_iso8601_invalid_date():
     assert parse_iso8601_date("not a date") is None
 
 
+def test_parse_iso8601_date_cached():
+    # Repeated dates (common in sitemaps) are only parsed once
+    date = parse_iso8601_date("2018-01-12T21:57:27Z")
+    assert parse_iso8601_date("2018-01-12T21:57:27Z") is date
+
+
 def test_parse_rfc2822_date():
     assert parse_rfc2822_date("Tue, 10 Aug 2010 20:43:53 -0000") == datetime.datetime(
         year=2010,
@@ -111,6 +120,11 @@ def test_parse_rfc2822_date():
     )
 
 
+def test_parse_rfc2822_date_cached():
+    date = parse_rfc2822_date("Tue, 10 Aug 2010 20:43:53 -0000")
+    assert parse_rfc2822_date("Tue, 10 Aug 2010 20:43:53 -0000") is date
+
+
 def test_parse_rfc2822_date_invalid_date():
     # GH#31
     assert parse_rfc2822_date("Fri, 18 Jun 2021 112:13:04 UTC") is None
@@ -231,6 +245,125 @@ def test_gunzip_above_max_output_bytes():
     assert "Gunzipped data exceeds maximum output size" in str(exc_info.value)
 
 
+class ChunkedWebClientSuccessResponse(AbstractWebClientSuccessResponse):
+    """Response which returns its raw data in tiny chunks."""
+
+    def __init__(self, url: str, data: bytes, chunk_size: int = 3):
+        self._url = url
+        self._data = data
+        self._chunk_size = chunk_size
+
+    def status_code(self) -> int:
+        return 200
+
+    def status_message(self) -> str:
+        return "OK"
+
+    def header(self, case_insensitive_name: str) -> str | None:
+        return None
+
+    def raw_data(self) -> bytes:
+        return self._data
+
+    def iter_data(self, chunk_size: int) -> Iterator[bytes]:
+        # Ignore the requested chunk size to exercise chunk boundaries
+        for i in range(0, len(self._data), self._chunk_size):
+            yield self._data[i : i + self._chunk_size]
+
+    def url(self) -> str:
+        return self._url
+
+
+def test_ungzipped_response_chunks():
+    url = "http://example.com/sitemap.xml.gz"
+    data = "<urlset>šiaurė</urlset>"
+
+    response = ChunkedWebClientSuccessResponse(url=url, data=gzip(data))
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data
+
+    # Multiple concatenated gzip members
+    response = ChunkedWebClientSuccessResponse(url=url, data=gzip(data) + gzip(data))
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data * 2
+
+
+def test_ungzipped_response_chunks_member_at_chunk_boundary():
+    url = "http://example.com/sitemap.xml.gz"
+    data = "<urlset>šiaurė</urlset>"
+    gzipped_data = gzip(data)
+
+    # Second gzip member starts exactly at the start of a chunk
+    response = ChunkedWebClientSuccessResponse(
+        url=url, data=gzipped_data * 2, chunk_size=len(gzipped_data)
+    )
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data * 2
+
+
+def test_ungzipped_response_chunks_zero_padding(caplog):
+    url = "http://example.com/sitemap.xml.gz"
+    data = "<urlset>šiaurė</urlset>"
+
+    response = ChunkedWebClientSuccessResponse(
+        url=url, data=gzip(data) + b"\0" * 1024 + gzip(data) + b"\0" * 10
+    )
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data * 2
+    assert "Unable to gunzip" not in caplog.text
+
+
+def test_ungzipped_response_chunks_trailing_garbage(caplog):
+    url = "http://example.com/sitemap.xml.gz"
+    data = "<urlset>šiaurė</urlset>"
+
+    response = ChunkedWebClientSuccessResponse(
+        url=url, data=gzip(data) + b"\0\0not gzipped"
+    )
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data
+    assert f"Unable to gunzip the rest of response for {url}" in caplog.text
+
+
+def test_ungzipped_response_chunks_utf8_bom():
+    url = "http://example.com/sitemap.xml"
+    data = "<urlset>šiaurė</urlset>"
+
+    # BOM and multibyte characters get split across chunks
+    response = ChunkedWebClientSuccessResponse(
+        url=url, data=data.encode("utf-8-sig"), chunk_size=1
+    )
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data
+
+
+def test_ungzipped_response_chunks_not_gzipped(caplog):
+    url = "http://example.com/sitemap.xml.gz"
+    data = "<urlset>šiaurė</urlset>"
+
+    response = ChunkedWebClientSuccessResponse(url=url, data=data.encode("utf-8"))
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data
+    assert f"Unable to gunzip response for {url}" in caplog.text
+
+
+def test_ungzipped_response_chunks_gzipped_without_gz_extension(caplog):
+    url = "http://example.com/sitemap.xml"
+    data = "<urlset>šiaurė</urlset>"
+
+    # Gzip magic number split across chunks
+    response = ChunkedWebClientSuccessResponse(url=url, data=gzip(data), chunk_size=1)
+    assert "".join(ungzipped_response_chunks(url=url, response=response)) == data
+    assert "Unable to gunzip" not in caplog.text
+
+
+def test_ungzipped_response_chunks_above_max_uncompressed_bytes():
+    url = "http://example.com/sitemap.xml.gz"
+
+    response = ChunkedWebClientSuccessResponse(
+        url=url, data=gzip(b"A" * 1024 * 1024), chunk_size=1024
+    )
+    content = "".join(
+        ungzipped_response_chunks(
+            url=url, response=response, max_uncompressed_bytes=512 * 1024
+        )
+    )
+    assert content == "A" * 512 * 1024
+
+
 class MockWebClientErrorResponse(WebClientErrorResponse):
     pass
 
@@ -2,12 +2,13 @@ import datetime
 import textwrap
 from email.utils import format_datetime
 
+import pytest
 import requests_mock as rq_mock
 from dateutil.tz import tzoffset
 
 
 class TreeTestBase:
-    TEST_BASE_URL = "http://test_ultimate-sitemap-parser.com"  # mocked by HTTPretty
+    TEST_BASE_URL = "http://test_ultimate-sitemap-parser.com"  # mocked by requests-mock
 
     # Publication / "last modified" date
     TEST_DATE_DATETIME = datetime.datetime(
@@ -27,6 +28,190 @@ class TreeTestBase:
     TEST_PUBLICATION_LANGUAGE = "en"
     TEST_PUBLICATION_NAME = "Test publication"
 
+    # Bodies served by init_basic_sitemap(), rendered once when the class is created
+    BASIC_ROBOTS_TXT = textwrap.dedent(
+        f"""
+        User-agent: *
+        Disallow: /whatever
+
+        Sitemap: {TEST_BASE_URL}/sitemap_pages.xml
+
+        # Intentionally spelled as "Site-map" as Google tolerates this:
+        # https://github.com/google/robotstxt/blob/master/robots.cc#L703 
+        Site-map: {TEST_BASE_URL}/sitemap_news_index_1.xml
+    """
+    ).strip()
+
+    BASIC_SITEMAP_PAGES_XML = textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <url>
+                <loc>{TEST_BASE_URL}/about.html</loc>
+                <lastmod>{TEST_DATE_STR_ISO8601}</lastmod>
+                <changefreq>monthly</changefreq>
+                <priority>0.8</priority>
+            </url>
+            <url>
+                <loc>{TEST_BASE_URL}/contact.html</loc>
+                <lastmod>{TEST_DATE_STR_ISO8601}</lastmod>
+
+                <!-- Invalid change frequency -->
+                <changefreq>when we feel like it</changefreq>
+
+                <!-- Invalid priority -->
+                <priority>1.1</priority>
+
+            </url>
+        </urlset>
+    """
+    ).strip()
+
+    BASIC_SITEMAP_NEWS_INDEX_1_XML = textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <sitemap>
+                <loc>{TEST_BASE_URL}/sitemap_news_1.xml</loc>
+                <lastmod>{TEST_DATE_STR_ISO8601}</lastmod>
+            </sitemap>
+            <sitemap>
+                <loc>{TEST_BASE_URL}/sitemap_news_index_2.xml</loc>
+                <lastmod>{TEST_DATE_STR_ISO8601}</lastmod>
+            </sitemap>
+        </sitemapindex>
+    """
+    ).strip()
+
+    BASIC_SITEMAP_NEWS_1_XML = textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+                xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+                xmlns:xhtml="http://www.w3.org/1999/xhtml">
+
+            <url>
+                <loc>{TEST_BASE_URL}/news/foo.html</loc>
+
+                <!-- Element present but empty -->
+                <lastmod />
+
+                <!-- Some other XML namespace -->
+                <xhtml:link rel="alternate"
+                            media="only screen and (max-width: 640px)"
+                            href="{TEST_BASE_URL}/news/foo.html?mobile=1" />
+
+                <news:news>
+                    <news:publication>
+                        <news:name>{TEST_PUBLICATION_NAME}</news:name>
+                        <news:language>{TEST_PUBLICATION_LANGUAGE}</news:language>
+                    </news:publication>
+                    <news:publication_date>{TEST_DATE_STR_ISO8601}</news:publication_date>
+                    <news:title>Foo &lt;foo&gt;</news:title>    <!-- HTML entity decoding -->
+                </news:news>
+            </url>
+
+            <!-- Has a duplicate story in /sitemap_news_2.xml -->
+            <url>
+                <loc>{TEST_BASE_URL}/news/bar.html</loc>
+                <xhtml:link rel="alternate"
+                            media="only screen and (max-width: 640px)"
+                            href="{TEST_BASE_URL}/news/bar.html?mobile=1" />
+                <news:news>
+                    <news:publication>
+                        <news:name>{TEST_PUBLICATION_NAME}</news:name>
+                        <news:language>{TEST_PUBLICATION_LANGUAGE}</news:language>
+                    </news:publication>
+                    <news:publication_date>{TEST_DATE_STR_ISO8601}</news:publication_date>
+                    <news:title>Bar &amp; bar</news:title>
+                </news:news>
+            </url>
+
+        </urlset>
+    """
+    ).strip()
+
+    BASIC_SITEMAP_NEWS_INDEX_2_XML = textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+
+            <sitemap>
+                <!-- Extra whitespace added around URL -->
+                <loc>  {TEST_BASE_URL}/sitemap_news_2.xml  </loc>
+                <lastmod>{TEST_DATE_STR_ISO8601}</lastmod>
+            </sitemap>
+
+            <!-- Nonexistent sitemap -->
+            <sitemap>
+                <loc>{TEST_BASE_URL}/sitemap_news_missing.xml</loc>
+                <lastmod>{TEST_DATE_STR_ISO8601}</lastmod>
+            </sitemap>
+
+        </sitemapindex>
+    """
+    ).strip()
+
+    BASIC_SITEMAP_NEWS_2_XML = textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+                xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+                xmlns:xhtml="http://www.w3.org/1999/xhtml">
+
+            <!-- Has a duplicate story in /sitemap_news_1.xml -->
+            <url>
+                <!-- Extra whitespace added around URL -->
+                <loc>  {TEST_BASE_URL}/news/bar.html  </loc>
+                <xhtml:link rel="alternate"
+                            media="only screen and (max-width: 640px)"
+                            href="{TEST_BASE_URL}/news/bar.html?mobile=1#fragment_is_to_be_removed" />
+                <news:news>
+                    <news:publication>
+                        <news:name>{TEST_PUBLICATION_NAME}</news:name>
+                        <news:language>{TEST_PUBLICATION_LANGUAGE}</news:language>
+                    </news:publication>
+                    <news:publication_date>{TEST_DATE_STR_ISO8601}</news:publication_date>
+
+                    <tag_without_inner_character_data name="value" />
+
+                    <news:title>Bar &amp; bar</news:title>
+                </news:news>
+            </url>
+
+            <url>
+                <loc>{TEST_BASE_URL}/news/baz.html</loc>
+                <xhtml:link rel="alternate"
+                            media="only screen and (max-width: 640px)"
+                            href="{TEST_BASE_URL}/news/baz.html?mobile=1" />
+                <news:news>
+                    <news:publication>
+                        <news:name>{TEST_PUBLICATION_NAME}</news:name>
+                        <news:language>{TEST_PUBLICATION_LANGUAGE}</news:language>
+                    </news:publication>
+                    <news:publication_date>{TEST_DATE_STR_ISO8601}</news:publication_date>
+                    <news:title><![CDATA[Bąž]]></news:title>    <!-- CDATA and UTF-8 -->
+                </news:news>
+            </url>
+
+        </urlset>
+    """
+    ).strip()
+
+    BASIC_XML_SITEMAPS = {
+        # One sitemap for random static pages
+        "/sitemap_pages.xml": BASIC_SITEMAP_PAGES_XML,
+        # Index sitemap pointing to sitemaps with stories
+        "/sitemap_news_index_1.xml": BASIC_SITEMAP_NEWS_INDEX_1_XML,
+        # First sitemap with actual stories
+        "/sitemap_news_1.xml": BASIC_SITEMAP_NEWS_1_XML,
+        # Another index sitemap pointing to a second sitemaps with stories
+        "/sitemap_news_index_2.xml": BASIC_SITEMAP_NEWS_INDEX_2_XML,
+        # Second sitemap with actual stories
+        "/sitemap_news_2.xml": BASIC_SITEMAP_NEWS_2_XML,
+    }
+    """XML sitemaps served by init_basic_sitemap(), keyed by path."""
+
     @staticmethod
     def fallback_to_404_not_found_matcher(request):
         """Reply with "404 Not Found" to unmatched URLs instead of throwing NoMockAddress."""
@@ -38,211 +223,48 @@ class TreeTestBase:
             text="<h1>404 Not Found!</h1>",
         )
 
-    def init_basic_sitemap(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
-        requests_mock.get(
-            self.TEST_BASE_URL + "/",
-            text="This is a homepage.",
+    @pytest.fixture(autouse=True)
+    def _fallback_to_404_not_found(self, requests_mock):
+        """Register the "404 Not Found" fallback before each test registers its own responses."""
+        requests_mock.add_matcher(self.fallback_to_404_not_found_matcher)
+
+    @classmethod
+    def robots_txt(cls, sitemap_path="/sitemap.xml"):
+        """Return a robots.txt which points to a single sitemap."""
+        return (
+            "User-agent: *\n"
+            "Disallow: /whatever\n"
+            "\n"
+            f"Sitemap: {cls.TEST_BASE_URL}{sitemap_path}"
         )
 
+    def init_robots_txt(self, requests_mock, sitemap_path="/sitemap.xml"):
+        """Serve a robots.txt which points to a single sitemap."""
         requests_mock.get(
             self.TEST_BASE_URL + "/robots.txt",
             headers={"Content-Type": "text/plain"},
-            text=textwrap.dedent(
-                f"""
-                User-agent: *
-                Disallow: /whatever
-
-                Sitemap: {self.TEST_BASE_URL}/sitemap_pages.xml
-
-                # Intentionally spelled as "Site-map" as Google tolerates this:
-                # https://github.com/google/robotstxt/blob/master/robots.cc#L703 
-                Site-map: {self.TEST_BASE_URL}/sitemap_news_index_1.xml
-            """
-            ).strip(),
-        )
-
-        # One sitemap for random static pages
-        requests_mock.get(
-            self.TEST_BASE_URL + "/sitemap_pages.xml",
-            headers={"Content-Type": "application/xml"},
-            text=textwrap.dedent(
-                f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/about.html</loc>
-                        <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-                        <changefreq>monthly</changefreq>
-                        <priority>0.8</priority>
-                    </url>
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/contact.html</loc>
-                        <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-
-                        <!-- Invalid change frequency -->
-                        <changefreq>when we feel like it</changefreq>
-
-                        <!-- Invalid priority -->
-                        <priority>1.1</priority>
-
-                    </url>
-                </urlset>
-            """
-            ).strip(),
+            text=self.robots_txt(sitemap_path),
         )
 
-        # Index sitemap pointing to sitemaps with stories
-        requests_mock.get(
-            self.TEST_BASE_URL + "/sitemap_news_index_1.xml",
-            headers={"Content-Type": "application/xml"},
-            text=textwrap.dedent(
-                f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-                    <sitemap>
-                        <loc>{self.TEST_BASE_URL}/sitemap_news_1.xml</loc>
-                        <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-                    </sitemap>
-                    <sitemap>
-                        <loc>{self.TEST_BASE_URL}/sitemap_news_index_2.xml</loc>
-                        <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-                    </sitemap>
-                </sitemapindex>
-            """
-            ).strip(),
-        )
-
-        # First sitemap with actual stories
+    def init_basic_sitemap(self, requests_mock):
         requests_mock.get(
-            self.TEST_BASE_URL + "/sitemap_news_1.xml",
-            headers={"Content-Type": "application/xml"},
-            text=textwrap.dedent(
-                f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
-                        xmlns:xhtml="http://www.w3.org/1999/xhtml">
-
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/news/foo.html</loc>
-
-                        <!-- Element present but empty -->
-                        <lastmod />
-
-                        <!-- Some other XML namespace -->
-                        <xhtml:link rel="alternate"
-                                    media="only screen and (max-width: 640px)"
-                                    href="{self.TEST_BASE_URL}/news/foo.html?mobile=1" />
-
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                            <news:title>Foo &lt;foo&gt;</news:title>    <!-- HTML entity decoding -->
-                        </news:news>
-                    </url>
-
-                    <!-- Has a duplicate story in /sitemap_news_2.xml -->
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/news/bar.html</loc>
-                        <xhtml:link rel="alternate"
-                                    media="only screen and (max-width: 640px)"
-                                    href="{self.TEST_BASE_URL}/news/bar.html?mobile=1" />
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                            <news:title>Bar &amp; bar</news:title>
-                        </news:news>
-                    </url>
-
-                </urlset>
-            """
-            ).strip(),
+            self.TEST_BASE_URL + "/",
+            text="This is a homepage.",
         )
 
-        # Another index sitemap pointing to a second sitemaps with stories
         requests_mock.get(
-            self.TEST_BASE_URL + "/sitemap_news_index_2.xml",
-            headers={"Content-Type": "application/xml"},
-            text=textwrap.dedent(
-                f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-
-                    <sitemap>
-                        <!-- Extra whitespace added around URL -->
-                        <loc>  {self.TEST_BASE_URL}/sitemap_news_2.xml  </loc>
-                        <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-                    </sitemap>
-
-                    <!-- Nonexistent sitemap -->
-                    <sitemap>
-                        <loc>{self.TEST_BASE_URL}/sitemap_news_missing.xml</loc>
-                        <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-                    </sitemap>
-
-                </sitemapindex>
-            """
-            ).strip(),
+            self.TEST_BASE_URL + "/robots.txt",
+            headers={"Content-Type": "text/plain"},
+            text=self.BASIC_ROBOTS_TXT,
         )
 
-        # Second sitemap with actual stories
-        requests_mock.get(
-            self.TEST_BASE_URL + "/sitemap_news_2.xml",
-            headers={"Content-Type": "application/xml"},
-            text=textwrap.dedent(
-                f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
-                        xmlns:xhtml="http://www.w3.org/1999/xhtml">
-
-                    <!-- Has a duplicate story in /sitemap_news_1.xml -->
-                    <url>
-                        <!-- Extra whitespace added around URL -->
-                        <loc>  {self.TEST_BASE_URL}/news/bar.html  </loc>
-                        <xhtml:link rel="alternate"
-                                    media="only screen and (max-width: 640px)"
-                                    href="{self.TEST_BASE_URL}/news/bar.html?mobile=1#fragment_is_to_be_removed" />
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-
-                            <tag_without_inner_character_data name="value" />
-
-                            <news:title>Bar &amp; bar</news:title>
-                        </news:news>
-                    </url>
-
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/news/baz.html</loc>
-                        <xhtml:link rel="alternate"
-                                    media="only screen and (max-width: 640px)"
-                                    href="{self.TEST_BASE_URL}/news/baz.html?mobile=1" />
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                            <news:title><![CDATA[Bąž]]></news:title>    <!-- CDATA and UTF-8 -->
-                        </news:news>
-                    </url>
-
-                </urlset>
-            """
-            ).strip(),
-        )
+        xml_headers = {"Content-Type": "application/xml"}
+        for path, body in self.BASIC_XML_SITEMAPS.items():
+            requests_mock.get(
+                self.TEST_BASE_URL + path,
+                headers=xml_headers,
+                text=body,
+            )
 
         # Nonexistent sitemap
         requests_mock.get(
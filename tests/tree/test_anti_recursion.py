@@ -7,22 +7,7 @@ from usp.tree import sitemap_tree_for_homepage
 
 class TestTreeAntiRecursion(TreeTestBase):
     def test_301_redirect_to_root(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
-        requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-            """
-                ).strip()
-            ),
-        )
+        self.init_robots_txt(requests_mock)
 
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml",
@@ -58,22 +43,7 @@ class TestTreeAntiRecursion(TreeTestBase):
         )
 
     def test_cyclic_sitemap(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
-        requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap_1.xml
-            """
-                ).strip()
-            ),
-        )
+        self.init_robots_txt(requests_mock, "/sitemap_1.xml")
 
         for i in range(3):
             requests_mock.get(
@@ -121,22 +91,7 @@ class TestTreeAntiRecursion(TreeTestBase):
         )
 
     def test_self_pointing_index(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
-        requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-            """
-                ).strip()
-            ),
-        )
+        self.init_robots_txt(requests_mock)
 
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml",
@@ -167,22 +122,7 @@ class TestTreeAntiRecursion(TreeTestBase):
         )
 
     def test_known_path_redirects(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
-        requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-            """
-                ).strip()
-            ),
-        )
+        self.init_robots_txt(requests_mock)
 
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml",
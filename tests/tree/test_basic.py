@@ -1,5 +1,6 @@
 import difflib
 import textwrap
+import tracemalloc
 from decimal import Decimal
 
 from tests.helpers import gzip
@@ -18,12 +19,105 @@ from usp.objects.sitemap import (
 )
 from usp.tree import sitemap_tree_for_homepage
 
+HUGE_SITEMAP_PAGE_COUNT = 1000
+HUGE_SITEMAP_PADDING_LENGTH = 10 * 1024
+
+
+def _gzipped_huge_sitemap_xml(page_count: int) -> tuple[bytes, int]:
+    """Build a gzipped sitemap with lots of pages, and return it together with its uncompressed size."""
+    # Everything but the page number is rendered once; "{x}" is filled in for each page
+    url_template = f"""
+                <url>
+                    <loc>{TreeTestBase.TEST_BASE_URL}/news/page_{{x}}.html</loc>
+
+                    <!-- Element present but empty -->
+                    <lastmod />
+
+                    <!-- Some other XML namespace -->
+                    <xhtml:link rel="alternate"
+                                media="only screen and (max-width: 640px)"
+                                href="{TreeTestBase.TEST_BASE_URL}/news/page_{{x}}.html?mobile=1" />
+
+                    <news:news>
+                        <news:publication>
+                            <news:name>{TreeTestBase.TEST_PUBLICATION_NAME}</news:name>
+                            <news:language>{TreeTestBase.TEST_PUBLICATION_LANGUAGE}</news:language>
+                        </news:publication>
+                        <news:publication_date>{TreeTestBase.TEST_DATE_STR_ISO8601}</news:publication_date>
+                        <news:title>Foo &lt;foo&gt;</news:title>    <!-- HTML entity decoding -->
+                    </news:news>
+
+                    <!-- {"x" * HUGE_SITEMAP_PADDING_LENGTH} -->
+                </url>
+            """
+
+    sitemap_xml = "".join(
+        [
+            """<?xml version="1.0" encoding="UTF-8"?>
+            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+                    xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+                    xmlns:xhtml="http://www.w3.org/1999/xhtml">
+        """,
+            *(url_template.format(x=x) for x in range(page_count)),
+            "</urlset>",
+        ]
+    )
+
+    encoded_sitemap_xml = sitemap_xml.encode("utf-8")
+
+    return gzip(encoded_sitemap_xml), len(encoded_sitemap_xml)
+
+
+def _news_sitemap_xml(path: str, title: str) -> str:
+    """Build a news sitemap with a single story, as served by the gzip test."""
+    return textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+                xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+            <url>
+                <loc>{TreeTestBase.TEST_BASE_URL}{path}</loc>
+                <news:news>
+                    <news:publication>
+                        <news:name>{TreeTestBase.TEST_PUBLICATION_NAME}</news:name>
+                        <news:language>{TreeTestBase.TEST_PUBLICATION_LANGUAGE}</news:language>
+                    </news:publication>
+                    <news:publication_date>{TreeTestBase.TEST_DATE_STR_ISO8601}</news:publication_date>
+                    <news:title>{title}</news:title>
+                </news:news>
+            </url>
+        </urlset>
+    """
+    ).strip()
+
+
+# HTML entity decoding
+GZIPPED_SITEMAP_1 = gzip(_news_sitemap_xml("/news/foo.html", "Foo &lt;foo&gt;"))
+
+# CDATA and UTF-8
+GZIPPED_SITEMAP_2 = gzip(_news_sitemap_xml("/news/bar.html", "<![CDATA[Bąr]]>"))
+
+# Served as-is by sitemap_3 and gzipped by sitemap_4
+SITEMAP_3_XML = _news_sitemap_xml("/news/baz.html", "<![CDATA[Bąž]]>")
+GZIPPED_SITEMAP_4 = gzip(SITEMAP_3_XML)
+
 
 class TestTreeBasic(TreeTestBase):
     def test_sitemap_tree_for_homepage(self, requests_mock):
         """Test sitemap_tree_for_homepage()."""
         self.init_basic_sitemap(requests_mock)
 
+        # Listed in both news sitemaps
+        bar_page = SitemapPage(
+            url=f"{self.TEST_BASE_URL}/news/bar.html",
+            news_story=SitemapNewsStory(
+                title="Bar & bar",
+                publish_date=self.TEST_DATE_DATETIME,
+                publication_name=self.TEST_PUBLICATION_NAME,
+                publication_language=self.TEST_PUBLICATION_LANGUAGE,
+            ),
+        )
+
         expected_sitemap_tree = IndexWebsiteSitemap(
             url=f"{self.TEST_BASE_URL}/",
             sub_sitemaps=[
@@ -66,15 +160,7 @@ class TestTreeBasic(TreeTestBase):
                                                 publication_language=self.TEST_PUBLICATION_LANGUAGE,
                                             ),
                                         ),
-                                        SitemapPage(
-                                            url=f"{self.TEST_BASE_URL}/news/bar.html",
-                                            news_story=SitemapNewsStory(
-                                                title="Bar & bar",
-                                                publish_date=self.TEST_DATE_DATETIME,
-                                                publication_name=self.TEST_PUBLICATION_NAME,
-                                                publication_language=self.TEST_PUBLICATION_LANGUAGE,
-                                            ),
-                                        ),
+                                        bar_page,
                                     ],
                                 ),
                                 IndexXMLSitemap(
@@ -83,15 +169,7 @@ class TestTreeBasic(TreeTestBase):
                                         PagesXMLSitemap(
                                             url=f"{self.TEST_BASE_URL}/sitemap_news_2.xml",
                                             pages=[
-                                                SitemapPage(
-                                                    url=f"{self.TEST_BASE_URL}/news/bar.html",
-                                                    news_story=SitemapNewsStory(
-                                                        title="Bar & bar",
-                                                        publish_date=self.TEST_DATE_DATETIME,
-                                                        publication_name=self.TEST_PUBLICATION_NAME,
-                                                        publication_language=self.TEST_PUBLICATION_LANGUAGE,
-                                                    ),
-                                                ),
+                                                bar_page,
                                                 SitemapPage(
                                                     url=f"{self.TEST_BASE_URL}/news/baz.html",
                                                     news_story=SitemapNewsStory(
@@ -121,22 +199,30 @@ class TestTreeBasic(TreeTestBase):
 
         actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
 
-        expected_lines = str(expected_sitemap_tree).split()
-        actual_lines = str(actual_sitemap_tree).split()
-        print(actual_lines)
-        diff = difflib.ndiff(expected_lines, actual_lines)
-        diff_str = "\n".join(diff)
+        # The diff is only computed if the assertion fails
+        assert expected_sitemap_tree == actual_sitemap_tree, "\n".join(
+            difflib.ndiff(
+                str(expected_sitemap_tree).split(), str(actual_sitemap_tree).split()
+            )
+        )
 
-        assert expected_sitemap_tree == actual_sitemap_tree, diff_str
+        assert sum(1 for _ in actual_sitemap_tree.all_pages()) == 6
+        assert sum(1 for _ in actual_sitemap_tree.all_sitemaps()) == 7
 
-        assert len(list(actual_sitemap_tree.all_pages())) == 6
-        assert len(list(actual_sitemap_tree.all_sitemaps())) == 7
+        # Sitemaps are listed depth-first, each one before its sub-sitemaps
+        assert [sitemap.url for sitemap in actual_sitemap_tree.all_sitemaps()] == [
+            f"{self.TEST_BASE_URL}/robots.txt",
+            f"{self.TEST_BASE_URL}/sitemap_pages.xml",
+            f"{self.TEST_BASE_URL}/sitemap_news_index_1.xml",
+            f"{self.TEST_BASE_URL}/sitemap_news_1.xml",
+            f"{self.TEST_BASE_URL}/sitemap_news_index_2.xml",
+            f"{self.TEST_BASE_URL}/sitemap_news_2.xml",
+            f"{self.TEST_BASE_URL}/sitemap_news_missing.xml",
+        ]
 
     def test_sitemap_tree_for_homepage_gzip(self, requests_mock, caplog):
         """Test sitemap_tree_for_homepage() with gzipped sitemaps."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -161,106 +247,28 @@ class TestTreeBasic(TreeTestBase):
         # Gzipped sitemap without correct HTTP header but with .gz extension
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap_1.gz",
-            content=gzip(
-                textwrap.dedent(
-                    f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/news/foo.html</loc>
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                            <news:title>Foo &lt;foo&gt;</news:title>    <!-- HTML entity decoding -->
-                        </news:news>
-                    </url>
-                </urlset>
-            """
-                ).strip()
-            ),
+            content=GZIPPED_SITEMAP_1,
         )
 
         # Gzipped sitemap with correct HTTP header but without .gz extension
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap_2.dat",
             headers={"Content-Type": "application/x-gzip"},
-            content=gzip(
-                textwrap.dedent(
-                    f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/news/bar.html</loc>
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                            <news:title><![CDATA[Bąr]]></news:title>    <!-- CDATA and UTF-8 -->
-                        </news:news>
-                    </url>
-                </urlset>
-            """
-                ).strip()
-            ),
+            content=GZIPPED_SITEMAP_2,
         )
 
         # Sitemap which appears to be gzipped (due to extension and Content-Type) but really isn't
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap_3.xml.gz",
             headers={"Content-Type": "application/x-gzip"},
-            text=textwrap.dedent(
-                f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/news/baz.html</loc>
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                            <news:title><![CDATA[Bąž]]></news:title>    <!-- CDATA and UTF-8 -->
-                        </news:news>
-                    </url>
-                </urlset>
-            """
-            ).strip(),
+            text=SITEMAP_3_XML,
         )
 
         # Sitemap encoded as gzip for transport by the web server
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap_4.xml",
             headers={"Content-Type": "application/xml", "Content-Encoding": "gzip"},
-            content=gzip(
-                textwrap.dedent(
-                    f"""
-                <?xml version="1.0" encoding="UTF-8"?>
-                <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
-                    <url>
-                        <loc>{self.TEST_BASE_URL}/news/baz.html</loc>
-                        <news:news>
-                            <news:publication>
-                                <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                                <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                            </news:publication>
-                            <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                            <news:title><![CDATA[Bąž]]></news:title>    <!-- CDATA and UTF-8 -->
-                        </news:news>
-                    </url>
-                </urlset>
-            """
-                ).strip()
-            ),
+            content=GZIPPED_SITEMAP_4,
         )
 
         actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
@@ -311,41 +319,6 @@ class TestTreeBasic(TreeTestBase):
     def test_sitemap_tree_for_homepage_huge_sitemap(self, requests_mock):
         """Test sitemap_tree_for_homepage() with a huge sitemap (mostly for profiling)."""
 
-        page_count = 1000
-
-        sitemap_xml = """<?xml version="1.0" encoding="UTF-8"?>
-            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                    xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
-                    xmlns:xhtml="http://www.w3.org/1999/xhtml">
-        """
-        for x in range(page_count):
-            sitemap_xml += f"""
-                <url>
-                    <loc>{self.TEST_BASE_URL}/news/page_{x}.html</loc>
-
-                    <!-- Element present but empty -->
-                    <lastmod />
-
-                    <!-- Some other XML namespace -->
-                    <xhtml:link rel="alternate"
-                                media="only screen and (max-width: 640px)"
-                                href="{self.TEST_BASE_URL}/news/page_{x}.html?mobile=1" />
-
-                    <news:news>
-                        <news:publication>
-                            <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                            <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                        </news:publication>
-                        <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                        <news:title>Foo &lt;foo&gt;</news:title>    <!-- HTML entity decoding -->
-                    </news:news>
-                </url>
-            """
-
-        sitemap_xml += "</urlset>"
-
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -364,13 +337,36 @@ class TestTreeBasic(TreeTestBase):
             ).strip(),
         )
 
+        # Padded sitemap is large, so only build it when this test runs, and keep only its size uncompressed
+        gzipped_sitemap_xml, sitemap_xml_size = _gzipped_huge_sitemap_xml(
+            HUGE_SITEMAP_PAGE_COUNT
+        )
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml.gz",
             headers={"Content-Type": "application/x-gzip"},
-            content=gzip(sitemap_xml),
+            content=gzipped_sitemap_xml,
         )
 
-        actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
+        tracemalloc.start()
+        try:
+            actual_sitemap_tree = sitemap_tree_for_homepage(
+                homepage_url=self.TEST_BASE_URL
+            )
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Sitemap gets gunzipped and parsed incrementally, so the whole (padded) document is never held in memory
+        assert peak_memory < sitemap_xml_size // 2
 
-        assert len(list(actual_sitemap_tree.all_pages())) == page_count
-        assert len(list(actual_sitemap_tree.all_sitemaps())) == 2
+        assert (
+            sum(1 for _ in actual_sitemap_tree.all_pages()) == HUGE_SITEMAP_PAGE_COUNT
+        )
+        assert sum(1 for _ in actual_sitemap_tree.all_sitemaps()) == 2
+
+        # Publication name repeated in every story is shared instead of copied
+        publication_names = {
+            id(page.news_story.publication_name)
+            for page in actual_sitemap_tree.all_pages()
+        }
+        assert len(publication_names) == 1
@@ -1,6 +1,10 @@
+import io
 import textwrap
 from decimal import Decimal
 
+import pytest
+import requests
+
 from tests.tree.base import TreeTestBase
 from usp.objects.page import SitemapPage, SitemapPageChangeFrequency
 from usp.objects.sitemap import (
@@ -12,45 +16,142 @@ from usp.objects.sitemap import (
 )
 from usp.tree import sitemap_tree_for_homepage
 
+UTF8_BOM_ROBOTS_TXT = TreeTestBase.robots_txt().encode("utf-8-sig")
+
+UTF8_BOM_SITEMAP_XML = (
+    textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+                xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+            <url>
+                <loc>{TreeTestBase.TEST_BASE_URL}/news/first.html</loc>
+                <news:news>
+                    <news:publication>
+                        <news:name>{TreeTestBase.TEST_PUBLICATION_NAME}</news:name>
+                        <news:language>{TreeTestBase.TEST_PUBLICATION_LANGUAGE}</news:language>
+                    </news:publication>
+                    <news:publication_date>{TreeTestBase.TEST_DATE_STR_ISO8601}</news:publication_date>
+                    <news:title>First story</news:title>
+                </news:news>
+            </url>
+        </urlset>
+    """
+    )
+    .strip()
+    .encode("utf-8-sig")
+)
+
+SELF_REFERENCING_SITEMAP_XML = textwrap.dedent(
+    f"""
+    <?xml version="1.0" encoding="UTF-8"?>
+    <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <sitemap>
+            <loc>{TreeTestBase.TEST_BASE_URL}/sitemap.xml</loc>
+            <lastmod>2024-01-01</lastmod>
+        </sitemap>
+    </sitemapindex>
+"""
+).strip()
+
+ROBOTS_TXT_REFERENCING_SITEMAP_XML = textwrap.dedent(
+    f"""
+    <?xml version="1.0" encoding="UTF-8"?>
+    <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <sitemap>
+            <loc>{TreeTestBase.TEST_BASE_URL}/robots.txt</loc>
+            <lastmod>2024-01-01</lastmod>
+        </sitemap>
+    </sitemapindex>
+"""
+).strip()
+
+NO_NS_SITEMAP_INDEX_XML = textwrap.dedent(
+    f"""
+    <?xml version="1.0" encoding="UTF-8"?>
+    <sitemapindex>
+        <sitemap>
+            <loc>{TreeTestBase.TEST_BASE_URL}/sitemap_pages.xml</loc>
+            <lastmod>{TreeTestBase.TEST_DATE_STR_ISO8601}</lastmod>
+        </sitemap>
+    </sitemapindex>
+"""
+).strip()
+
+# random_tag is to check assuming sitemap namespace doesn't cause issues
+NO_NS_SITEMAP_PAGES_XML = textwrap.dedent(
+    f"""
+    <?xml version="1.0" encoding="UTF-8"?>
+    <urlset>
+        <url>
+            <loc>{TreeTestBase.TEST_BASE_URL}/about.html</loc>
+            <lastmod>{TreeTestBase.TEST_DATE_STR_ISO8601}</lastmod>
+            <changefreq>monthly</changefreq>
+            <priority>0.8</priority>
+            <random_tag>random_value</random_tag>
+        </url>
+    </urlset>
+"""
+).strip()
+
+TRUNCATED_SITEMAP_XML_START = textwrap.dedent(
+    """
+    <?xml version="1.0" encoding="UTF-8"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+            xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+            xmlns:xhtml="http://www.w3.org/1999/xhtml">
+"""
+).strip()
+
+
+def _truncated_sitemap_xml(page_count: int) -> str:
+    """Sitemap with the given number of pages, cut off before its closing tag."""
+    urls = "\n".join(
+        f"    <url><loc>{TreeTestBase.TEST_BASE_URL}/page_{x}.html</loc></url>"
+        for x in range(page_count)
+    )
+    return f"{TRUNCATED_SITEMAP_XML_START}\n{urls}"
+
+
+MISSING_CLOSE_URLSET_SITEMAP_XML = _truncated_sitemap_xml(50)
+
+MID_URL_SITEMAP_XML = (
+    _truncated_sitemap_xml(49) + f"\n    <url><loc>{TreeTestBase.TEST_BASE_URL}/page_"
+)
+
+MALFORMED_MID_BODY_SITEMAP_INDEX_XML = (
+    textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <sitemap>
+                <loc>{TreeTestBase.TEST_BASE_URL}/sitemap_pages.xml</loc>
+            </sitemap>
+            <<not xml>>
+    """
+    ).strip()
+    # Rest of the body won't get read
+    + "\n" * 1024
+)
+
+
+class ConnectionResetBody(io.BytesIO):
+    """Response body which fails with a connection error after some of it has been read."""
+
+    def __init__(self, data: bytes, readable_length: int):
+        super().__init__(data)
+        self._readable_length = readable_length
+
+    def read(self, *args, **kwargs):
+        if self.tell() >= self._readable_length:
+            raise ConnectionResetError("Connection reset by peer")
+        return super().read(*args, **kwargs)
+
 
 class TestTreeEdgeCases(TreeTestBase):
     def test_sitemap_tree_for_homepage_utf8_bom(self, requests_mock):
         """Test sitemap_tree_for_homepage() with UTF-8 BOM in both robots.txt and sitemap."""
 
-        robots_txt_body = textwrap.dedent(
-            f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-        """
-        ).strip()
-
-        sitemap_xml_body = textwrap.dedent(
-            f"""
-            <?xml version="1.0" encoding="UTF-8"?>
-            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                    xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
-                <url>
-                    <loc>{self.TEST_BASE_URL}/news/first.html</loc>
-                    <news:news>
-                        <news:publication>
-                            <news:name>{self.TEST_PUBLICATION_NAME}</news:name>
-                            <news:language>{self.TEST_PUBLICATION_LANGUAGE}</news:language>
-                        </news:publication>
-                        <news:publication_date>{self.TEST_DATE_STR_ISO8601}</news:publication_date>
-                        <news:title>First story</news:title>
-                    </news:news>
-                </url>
-            </urlset>
-        """
-        ).strip()
-
-        robots_txt_body_encoded = robots_txt_body.encode("utf-8-sig")
-        sitemap_xml_body_encoded = sitemap_xml_body.encode("utf-8-sig")
-
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -59,231 +160,139 @@ class TestTreeEdgeCases(TreeTestBase):
         requests_mock.get(
             self.TEST_BASE_URL + "/robots.txt",
             headers={"Content-Type": "text/plain"},
-            content=robots_txt_body_encoded,
+            content=UTF8_BOM_ROBOTS_TXT,
         )
 
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml",
-            content=sitemap_xml_body_encoded,
+            content=UTF8_BOM_SITEMAP_XML,
         )
 
         actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
-        assert len(list(actual_sitemap_tree.all_pages())) == 1
-        assert len(list(actual_sitemap_tree.all_sitemaps())) == 2
-
-    def test_max_recursion_level_xml(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-        requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-        """
-                ).strip()
-            ),
-        )
+        assert sum(1 for _ in actual_sitemap_tree.all_pages()) == 1
+        assert sum(1 for _ in actual_sitemap_tree.all_sitemaps()) == 2
+
+    @pytest.mark.parametrize(
+        "sitemap_xml",
+        [
+            pytest.param(SELF_REFERENCING_SITEMAP_XML, id="xml"),
+            # GH#29
+            pytest.param(ROBOTS_TXT_REFERENCING_SITEMAP_XML, id="sitemap_with_robots"),
+        ],
+    )
+    def test_max_recursion_level(self, requests_mock, sitemap_xml):
+        self.init_robots_txt(requests_mock)
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml",
             headers={"Content-Type": "application/xml"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            <?xml version="1.0" encoding="UTF-8"?>
-            <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-                <sitemap>
-                    <loc>{self.TEST_BASE_URL}/sitemap.xml</loc>
-                    <lastmod>2024-01-01</lastmod>
-                </sitemap>
-            </sitemapindex>
-            """
-                ).strip()
-            ),
+            text=sitemap_xml,
         )
 
         tree = sitemap_tree_for_homepage(self.TEST_BASE_URL)
         sitemaps = list(tree.all_sitemaps())
-
         assert type(sitemaps[-1]) is InvalidSitemap
 
-    def test_max_recursion_level_sitemap_with_robots(self, requests_mock):
-        # GH#29
+    def test_truncated_sitemap_missing_close_urlset(self, requests_mock):
+        self.init_robots_txt(requests_mock)
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-        requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-        """
-                ).strip()
-            ),
-        )
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml",
             headers={"Content-Type": "application/xml"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            <?xml version="1.0" encoding="UTF-8"?>
-            <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-                <sitemap>
-                    <loc>{self.TEST_BASE_URL}/robots.txt</loc>
-                    <lastmod>2024-01-01</lastmod>
-                </sitemap>
-            </sitemapindex>
-            """
-                ).strip()
-            ),
+            text=MISSING_CLOSE_URLSET_SITEMAP_XML,
         )
 
         tree = sitemap_tree_for_homepage(self.TEST_BASE_URL)
-        sitemaps = list(tree.all_sitemaps())
-        assert type(sitemaps[-1]) is InvalidSitemap
-
-    def test_truncated_sitemap_missing_close_urlset(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
-        requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-        """
-                ).strip()
-            ),
-        )
+        assert sum(1 for _ in tree.all_pages()) == 50
 
-        sitemap_xml = """<?xml version="1.0" encoding="UTF-8"?>
-            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                    xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
-                    xmlns:xhtml="http://www.w3.org/1999/xhtml">
-        """
-        for x in range(50):
-            sitemap_xml += f"""
-                <url>
-                    <loc>{self.TEST_BASE_URL}/page_{x}.html</loc>
-                </url>
-            """
+    def test_truncated_sitemap_mid_url(self, requests_mock):
+        self.init_robots_txt(requests_mock)
 
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap.xml",
             headers={"Content-Type": "application/xml"},
-            text=(textwrap.dedent(sitemap_xml).strip()),
+            text=MID_URL_SITEMAP_XML,
         )
 
         tree = sitemap_tree_for_homepage(self.TEST_BASE_URL)
-        assert len(list(tree.all_pages())) == 50
+        all_pages = list(tree.all_pages())
+        assert len(all_pages) == 49
+        assert all_pages[-1].url.endswith("page_48.html")
 
-    def test_truncated_sitemap_mid_url(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
+    def test_malformed_sitemap_response_closed(self, requests_mock, mocker):
+        # Read the sitemap index in small chunks so that parsing fails before the end of it
+        mocker.patch("usp.helpers.RESPONSE_CHUNK_SIZE", 64)
+        response_close = mocker.spy(requests.Response, "close")
 
+        self.init_robots_txt(requests_mock, "/sitemap_index.xml")
         requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=(
-                textwrap.dedent(
-                    f"""
-            User-agent: *
-            Disallow: /whatever
-
-            Sitemap: {self.TEST_BASE_URL}/sitemap.xml
-        """
-                ).strip()
-            ),
+            self.TEST_BASE_URL + "/sitemap_index.xml",
+            headers={"Content-Type": "application/xml"},
+            text=MALFORMED_MID_BODY_SITEMAP_INDEX_XML,
         )
 
-        sitemap_xml = """<?xml version="1.0" encoding="UTF-8"?>
-            <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-                    xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
-                    xmlns:xhtml="http://www.w3.org/1999/xhtml">
-        """
-        for x in range(49):
-            sitemap_xml += f"""
-                <url>
-                    <loc>{self.TEST_BASE_URL}/page_{x}.html</loc>
-                </url>
-            """
-        sitemap_xml += f"""
-            <url>
-                <loc>{self.TEST_BASE_URL}/page_
-        """
+        closed_urls_before_sub_sitemap = []
+
+        def _sitemap_pages_xml(request, context):
+            closed_urls_before_sub_sitemap.extend(
+                c.args[0].url for c in response_close.call_args_list
+            )
+            return NO_NS_SITEMAP_PAGES_XML
 
         requests_mock.get(
-            self.TEST_BASE_URL + "/sitemap.xml",
+            self.TEST_BASE_URL + "/sitemap_pages.xml",
             headers={"Content-Type": "application/xml"},
-            text=(textwrap.dedent(sitemap_xml).strip()),
+            text=_sitemap_pages_xml,
         )
 
-        tree = sitemap_tree_for_homepage(self.TEST_BASE_URL)
-        all_pages = list(tree.all_pages())
-        assert len(all_pages) == 49
-        assert all_pages[-1].url.endswith("page_48.html")
+        tree = sitemap_tree_for_homepage(self.TEST_BASE_URL, use_known_paths=False)
 
-    def test_sitemap_no_ns(self, requests_mock, caplog):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
+        assert sum(1 for _ in tree.all_pages()) == 1
+        assert (
+            f"{self.TEST_BASE_URL}/sitemap_index.xml" in closed_urls_before_sub_sitemap
+        )
+
+    def test_sitemap_connection_error_mid_body(self, requests_mock, mocker):
+        mocker.patch("usp.helpers.RESPONSE_CHUNK_SIZE", 64)
 
+        self.init_robots_txt(requests_mock, "/sitemap_index.xml")
+        sitemap_index_xml = NO_NS_SITEMAP_INDEX_XML.encode("utf-8")
         requests_mock.get(
-            self.TEST_BASE_URL + "/robots.txt",
-            headers={"Content-Type": "text/plain"},
-            text=textwrap.dedent(
-                f"""
-                        User-agent: *
-                        Disallow: /whatever
-
-                        Sitemap: {self.TEST_BASE_URL}/sitemap_index.xml
-                    """
-            ).strip(),
+            self.TEST_BASE_URL + "/sitemap_index.xml",
+            headers={"Content-Type": "application/xml"},
+            body=ConnectionResetBody(
+                sitemap_index_xml, readable_length=len(sitemap_index_xml) - 64
+            ),
         )
+        sitemap_pages_mock = requests_mock.get(
+            self.TEST_BASE_URL + "/sitemap_pages.xml",
+            headers={"Content-Type": "application/xml"},
+            text=NO_NS_SITEMAP_PAGES_XML,
+        )
+
+        tree = sitemap_tree_for_homepage(self.TEST_BASE_URL, use_known_paths=False)
+
+        # Partially read sitemap is treated as a failed fetch rather than parsed as far as it got
+        (sitemap_index,) = tree.sub_sitemaps[0].sub_sitemaps
+        assert type(sitemap_index) is InvalidSitemap
+        assert sitemap_index.reason.startswith(
+            f"Unable to fetch sitemap from {self.TEST_BASE_URL}/sitemap_index.xml: "
+        )
+        assert "Connection reset by peer" in sitemap_index.reason
+        assert not sitemap_pages_mock.called
+
+    def test_sitemap_no_ns(self, requests_mock, caplog):
+        self.init_robots_txt(requests_mock, "/sitemap_index.xml")
 
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap_index.xml",
             headers={"Content-Type": "application/xml"},
-            text=textwrap.dedent(
-                f"""
-                        <?xml version="1.0" encoding="UTF-8"?>
-                        <sitemapindex>
-                            <sitemap>
-                                <loc>{self.TEST_BASE_URL}/sitemap_pages.xml</loc>
-                                <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-                            </sitemap>
-                        </sitemapindex>
-                    """
-            ).strip(),
+            text=NO_NS_SITEMAP_INDEX_XML,
         )
 
-        # random_tag is to check assuming sitemap namespace doesn't cause issues
         requests_mock.get(
             self.TEST_BASE_URL + "/sitemap_pages.xml",
             headers={"Content-Type": "application/xml"},
-            text=textwrap.dedent(
-                f"""
-                        <?xml version="1.0" encoding="UTF-8"?>
-                        <urlset>
-                            <url>
-                                <loc>{self.TEST_BASE_URL}/about.html</loc>
-                                <lastmod>{self.TEST_DATE_STR_ISO8601}</lastmod>
-                                <changefreq>monthly</changefreq>
-                                <priority>0.8</priority>
-                                <random_tag>random_value</random_tag>
-                            </url>
-                        </urlset>
-                    """
-            ).strip(),
+            text=NO_NS_SITEMAP_PAGES_XML,
         )
 
         expected_sitemap_tree = IndexWebsiteSitemap(
@@ -36,7 +36,7 @@ class TestSitemapFromStr(TreeTestBase):
         )
 
         assert isinstance(parsed, PagesXMLSitemap)
-        assert len(list(parsed.all_pages())) == 2
+        assert sum(1 for _ in parsed.all_pages()) == 2
         assert all([isinstance(page, SitemapPage) for page in parsed.all_pages()])
 
     def test_xml_index(self):
@@ -1,10 +1,17 @@
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
+import requests
 
 from tests.tree.base import TreeTestBase
+from usp.exceptions import SitemapException
+from usp.fetch_parse import SitemapFetcher
+from usp.objects.sitemap import InvalidSitemap
 from usp.tree import sitemap_tree_for_homepage
+from usp.web_client.requests_client import RequestsWebClient
 
 
 class TestTreeOpts(TreeTestBase):
@@ -12,6 +19,32 @@ class TestTreeOpts(TreeTestBase):
     def mock_fetcher(self, mocker):
         return mocker.patch("usp.tree.SitemapFetcher")
 
+    @pytest.fixture
+    def sessions_by_thread(self, mocker):
+        """Record the requests sessions used by each thread."""
+        sessions_by_thread = {}
+        session_get = requests.Session.get
+
+        def _session_get(session, url, **kwargs):
+            sessions_by_thread.setdefault(threading.get_ident(), set()).add(session)
+            return session_get(session, url, **kwargs)
+
+        mocker.patch.object(requests.Session, "get", _session_get)
+        return sessions_by_thread
+
+    @staticmethod
+    def init_concurrent_requests(mocker, urls):
+        """Hold requests to the given URLs until all of them are being made at the same time."""
+        barrier = threading.Barrier(len(urls), timeout=10)
+        session_get = requests.Session.get
+
+        def _session_get(session, url, **kwargs):
+            if url in urls:
+                barrier.wait()
+            return session_get(session, url, **kwargs)
+
+        mocker.patch.object(requests.Session, "get", _session_get)
+
     def test_extra_known_paths(self, mock_fetcher):
         sitemap_tree_for_homepage(
             "https://example.org", extra_known_paths={"custom_sitemap.xml"}
@@ -24,6 +57,16 @@ class TestTreeOpts(TreeTestBase):
             quiet_404=True,
             recurse_callback=None,
             recurse_list_callback=None,
+            max_workers=1,
+        )
+
+    def test_shared_default_web_client(self, mock_fetcher):
+        sitemap_tree_for_homepage("https://example.org")
+
+        web_clients = {id(c.kwargs["web_client"]) for c in mock_fetcher.call_args_list}
+        assert len(web_clients) == 1
+        assert isinstance(
+            mock_fetcher.call_args_list[0].kwargs["web_client"], RequestsWebClient
         )
 
     def test_filter_callback(self, requests_mock):
@@ -39,7 +82,7 @@ class TestTreeOpts(TreeTestBase):
         )
 
         # robots, pages, news_index_1, news_index_2, missing
-        assert len(list(tree.all_sitemaps())) == 5
+        assert sum(1 for _ in tree.all_sitemaps()) == 5
         assert all("/news/" not in page.url for page in tree.all_pages())
 
     def test_filter_list_callback(self, requests_mock):
@@ -55,9 +98,117 @@ class TestTreeOpts(TreeTestBase):
         )
 
         # robots, pages, news_index_1, news_index_2, missing
-        assert len(list(tree.all_sitemaps())) == 5
+        assert sum(1 for _ in tree.all_sitemaps()) == 5
         assert all("/news/" not in page.url for page in tree.all_pages())
 
+    def test_max_workers(self, requests_mock, mocker):
+        self.init_basic_sitemap(requests_mock)
+
+        expected_sitemap_tree = sitemap_tree_for_homepage(self.TEST_BASE_URL)
+
+        executor = mocker.patch(
+            "usp.fetch_parse.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        )
+        fetcher = mocker.patch("usp.fetch_parse.SitemapFetcher", wraps=SitemapFetcher)
+        actual_sitemap_tree = sitemap_tree_for_homepage(
+            self.TEST_BASE_URL, max_workers=4
+        )
+
+        # Sub-sitemaps are fetched concurrently but end up in the same order
+        assert expected_sitemap_tree == actual_sitemap_tree
+        assert list(actual_sitemap_tree.all_pages()) == list(
+            expected_sitemap_tree.all_pages()
+        )
+
+        # Only the two sitemaps in robots.txt are fetched in a thread pool, and each of them fetches its own
+        # sub-sitemaps one at a time
+        executor.assert_called_once_with(max_workers=2)
+        assert fetcher.call_count == 6
+        assert all(c.kwargs["max_workers"] == 1 for c in fetcher.call_args_list)
+
+    def test_max_workers_concurrent_sub_sitemaps(
+        self, requests_mock, mocker, sessions_by_thread
+    ):
+        sub_sitemap_urls = [
+            f"{self.TEST_BASE_URL}/sitemap_1.xml",
+            f"{self.TEST_BASE_URL}/sitemap_2.xml",
+        ]
+
+        self.init_robots_txt(requests_mock, "/sitemap_index.xml")
+        requests_mock.get(
+            self.TEST_BASE_URL + "/sitemap_index.xml",
+            headers={"Content-Type": "application/xml"},
+            text=(
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                + "".join(
+                    f"<sitemap><loc>{url}</loc></sitemap>" for url in sub_sitemap_urls
+                )
+                + "</sitemapindex>"
+            ),
+        )
+        for url in sub_sitemap_urls:
+            requests_mock.get(
+                url,
+                headers={"Content-Type": "application/xml"},
+                text=self.BASIC_SITEMAP_PAGES_XML,
+            )
+        self.init_concurrent_requests(mocker, sub_sitemap_urls)
+
+        tree = sitemap_tree_for_homepage(
+            self.TEST_BASE_URL, use_known_paths=False, max_workers=4
+        )
+
+        # Sub-sitemaps would time out waiting for each other if they weren't fetched concurrently
+        assert not any(isinstance(s, InvalidSitemap) for s in tree.all_sitemaps())
+        assert sum(1 for _ in tree.all_sitemaps()) == 4
+
+        # Main thread and two worker threads, each with a session of its own
+        sessions = [s for ss in sessions_by_thread.values() for s in ss]
+        assert len(sessions_by_thread) == 3
+        assert len(set(sessions)) == len(sessions) == 3
+
+    def test_max_workers_known_paths(self, requests_mock, mocker, sessions_by_thread):
+        known_path_urls = [
+            f"{self.TEST_BASE_URL}/sitemap.xml",
+            f"{self.TEST_BASE_URL}/sitemap_news.xml",
+        ]
+        for url in known_path_urls:
+            requests_mock.get(
+                url,
+                headers={"Content-Type": "application/xml"},
+                text=self.BASIC_SITEMAP_PAGES_XML,
+            )
+
+        expected_sitemap_tree = sitemap_tree_for_homepage(
+            self.TEST_BASE_URL, use_robots=False
+        )
+
+        sessions_by_thread.clear()
+        self.init_concurrent_requests(mocker, known_path_urls)
+        executor = mocker.patch("usp.tree.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+        fetcher = mocker.patch("usp.tree.SitemapFetcher", wraps=SitemapFetcher)
+        actual_sitemap_tree = sitemap_tree_for_homepage(
+            self.TEST_BASE_URL, use_robots=False, max_workers=4
+        )
+
+        # Known paths would time out waiting for each other if they weren't probed concurrently
+        assert len(actual_sitemap_tree.sub_sitemaps) == 2
+        assert expected_sitemap_tree == actual_sitemap_tree
+
+        # Known paths are probed in a single thread pool, each of them then fetching its sub-sitemaps one at a time
+        executor.assert_called_once_with(max_workers=4)
+        assert all(c.kwargs["max_workers"] == 1 for c in fetcher.call_args_list)
+
+        # Every worker thread has a session of its own
+        sessions = [s for ss in sessions_by_thread.values() for s in ss]
+        assert len(sessions_by_thread) > 1
+        assert len(set(sessions)) == len(sessions) == len(sessions_by_thread)
+
+    def test_max_workers_invalid(self):
+        with pytest.raises(SitemapException):
+            sitemap_tree_for_homepage(self.TEST_BASE_URL, max_workers=0)
+
     def test_normalize_homepage_url_default_enabled(self, mock_fetcher):
         """
         By default, the homepage URL is normalized to the domain root.
@@ -72,6 +223,7 @@ class TestTreeOpts(TreeTestBase):
             parent_urls=set(),
             recurse_callback=None,
             recurse_list_callback=None,
+            max_workers=1,
         )
 
     def test_normalize_homepage_url_disabled(self, mock_fetcher):
@@ -91,6 +243,7 @@ class TestTreeOpts(TreeTestBase):
             parent_urls=set(),
             recurse_callback=None,
             recurse_list_callback=None,
+            max_workers=1,
         )
 
     def test_normalize_homepage_url_with_extra_known_paths(self, mock_fetcher):
@@ -112,6 +265,7 @@ class TestTreeOpts(TreeTestBase):
             quiet_404=True,
             recurse_callback=None,
             recurse_list_callback=None,
+            max_workers=1,
         )
 
         mock_fetcher.assert_any_call(
@@ -122,6 +276,7 @@ class TestTreeOpts(TreeTestBase):
             quiet_404=True,
             recurse_callback=None,
             recurse_list_callback=None,
+            max_workers=1,
         )
 
     def test_skip_robots_txt(self, mock_fetcher):
@@ -144,4 +299,5 @@ class TestTreeOpts(TreeTestBase):
             quiet_404=True,
             recurse_callback=None,
             recurse_list_callback=None,
+            max_workers=1,
         )
@@ -12,8 +12,6 @@ class TestTreeRobots(TreeTestBase):
     def test_sitemap_tree_for_homepage_robots_txt_no_content_type(self, requests_mock):
         """Test sitemap_tree_for_homepage() with no Content-Type in robots.txt."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -47,8 +45,6 @@ class TestTreeRobots(TreeTestBase):
     def test_sitemap_tree_for_homepage_no_robots_txt(self, requests_mock):
         """Test sitemap_tree_for_homepage() with no robots.txt."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -75,8 +71,6 @@ class TestTreeRobots(TreeTestBase):
     def test_sitemap_tree_for_homepage_robots_txt_weird_spacing(self, requests_mock):
         """Test sitemap_tree_for_homepage() with weird (but valid) spacing."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -117,5 +111,87 @@ class TestTreeRobots(TreeTestBase):
         )
 
         actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
-        assert len(list(actual_sitemap_tree.all_pages())) == 1
-        assert len(list(actual_sitemap_tree.all_sitemaps())) == 2
+        assert sum(1 for _ in actual_sitemap_tree.all_pages()) == 1
+        assert sum(1 for _ in actual_sitemap_tree.all_sitemaps()) == 2
+
+    def test_sitemap_tree_for_homepage_robots_txt_line_endings(self, requests_mock):
+        """Test sitemap_tree_for_homepage() with mixed line endings and commented out sitemaps."""
+
+        robots_txt_body = (
+            "User-agent: *\r\n"
+            f"Sitemap: {self.TEST_BASE_URL}/sitemap_1.xml\r\n"
+            f"# Sitemap: {self.TEST_BASE_URL}/sitemap_commented.xml\r"
+            f"sitemap: {self.TEST_BASE_URL}/sitemap_2.xml\n"
+            "Sitemap: \n"
+            f"Disallow: /sitemap: {self.TEST_BASE_URL}/sitemap_disallowed.xml\n"
+        )
+
+        requests_mock.get(
+            self.TEST_BASE_URL + "/robots.txt",
+            headers={"Content-Type": "text/plain"},
+            text=robots_txt_body,
+        )
+
+        actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
+        robots_txt_sitemap = actual_sitemap_tree.sub_sitemaps[0]
+
+        assert isinstance(robots_txt_sitemap, IndexRobotsTxtSitemap)
+        assert [sitemap.url for sitemap in robots_txt_sitemap.sub_sitemaps] == [
+            f"{self.TEST_BASE_URL}/sitemap_1.xml",
+            f"{self.TEST_BASE_URL}/sitemap_2.xml",
+        ]
+
+    def test_sitemap_tree_for_homepage_robots_txt_fetched_once(self, requests_mock):
+        """Test that robots.txt is fetched and parsed only once, even if a sitemap links back to it."""
+
+        robots_txt_mock = requests_mock.get(
+            self.TEST_BASE_URL + "/robots.txt",
+            headers={"Content-Type": "text/plain"},
+            text=f"Sitemap: {self.TEST_BASE_URL}/sitemap.xml",
+        )
+
+        requests_mock.get(
+            self.TEST_BASE_URL + "/sitemap.xml",
+            text=textwrap.dedent(
+                f"""
+                <?xml version="1.0" encoding="UTF-8"?>
+                <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                    <sitemap>
+                        <loc>{self.TEST_BASE_URL}/robots.txt</loc>
+                    </sitemap>
+                </sitemapindex>
+            """
+            ).strip(),
+        )
+
+        sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
+
+        assert robots_txt_mock.call_count == 1
+
+    def test_sitemap_tree_for_homepage_robots_txt_unicode_line_boundaries(
+        self, requests_mock
+    ):
+        """Test sitemap_tree_for_homepage() with robots.txt lines split by str.splitlines() boundaries."""
+
+        robots_txt_body = (
+            "User-agent: *\x85"
+            f"Sitemap: {self.TEST_BASE_URL}/sitemap_1.xml "
+            f"Disallow: /whatever\x0bsitemap: {self.TEST_BASE_URL}/sitemap_2.xml\x0c"
+            # Directive and URL on separate lines
+            f"Site-map:\x85{self.TEST_BASE_URL}/sitemap_split.xml\n"
+        )
+
+        requests_mock.get(
+            self.TEST_BASE_URL + "/robots.txt",
+            headers={"Content-Type": "text/plain"},
+            text=robots_txt_body,
+        )
+
+        actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
+        robots_txt_sitemap = actual_sitemap_tree.sub_sitemaps[0]
+
+        assert isinstance(robots_txt_sitemap, IndexRobotsTxtSitemap)
+        assert [sitemap.url for sitemap in robots_txt_sitemap.sub_sitemaps] == [
+            f"{self.TEST_BASE_URL}/sitemap_1.xml",
+            f"{self.TEST_BASE_URL}/sitemap_2.xml",
+        ]
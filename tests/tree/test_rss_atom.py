@@ -19,8 +19,6 @@ class TestTreeRssAtom(TreeTestBase):
     def test_sitemap_tree_for_homepage_rss_atom(self, requests_mock):
         """Test sitemap_tree_for_homepage() with RSS 2.0 / Atom 0.3 / Atom 1.0 feeds."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -176,57 +174,39 @@ class TestTreeRssAtom(TreeTestBase):
                             url=f"{self.TEST_BASE_URL}/sitemap_rss.xml",
                             pages=[
                                 SitemapPage(
-                                    url=f"{self.TEST_BASE_URL}/rss_story_1.html",
-                                    news_story=SitemapNewsStory(
-                                        title="Test RSS 2.0 story #1",
-                                        publish_date=self.TEST_DATE_DATETIME,
-                                    ),
-                                ),
-                                SitemapPage(
-                                    url=f"{self.TEST_BASE_URL}/rss_story_2.html",
+                                    url=f"{self.TEST_BASE_URL}/rss_story_{i}.html",
                                     news_story=SitemapNewsStory(
-                                        title="Test RSS 2.0 story #2",
+                                        title=f"Test RSS 2.0 story #{i}",
                                         publish_date=self.TEST_DATE_DATETIME,
                                     ),
-                                ),
+                                )
+                                for i in (1, 2)
                             ],
                         ),
                         PagesAtomSitemap(
                             url=f"{self.TEST_BASE_URL}/sitemap_atom_0_3.xml",
                             pages=[
                                 SitemapPage(
-                                    url=f"{self.TEST_BASE_URL}/atom_0_3_story_1.html",
-                                    news_story=SitemapNewsStory(
-                                        title="Test Atom 0.3 story #1",
-                                        publish_date=self.TEST_DATE_DATETIME,
-                                    ),
-                                ),
-                                SitemapPage(
-                                    url=f"{self.TEST_BASE_URL}/atom_0_3_story_2.html",
+                                    url=f"{self.TEST_BASE_URL}/atom_0_3_story_{i}.html",
                                     news_story=SitemapNewsStory(
-                                        title="Test Atom 0.3 story #2",
+                                        title=f"Test Atom 0.3 story #{i}",
                                         publish_date=self.TEST_DATE_DATETIME,
                                     ),
-                                ),
+                                )
+                                for i in (1, 2)
                             ],
                         ),
                         PagesAtomSitemap(
                             url=f"{self.TEST_BASE_URL}/sitemap_atom_1_0.xml",
                             pages=[
                                 SitemapPage(
-                                    url=f"{self.TEST_BASE_URL}/atom_1_0_story_1.html",
-                                    news_story=SitemapNewsStory(
-                                        title="Test Atom 1.0 story #1",
-                                        publish_date=self.TEST_DATE_DATETIME,
-                                    ),
-                                ),
-                                SitemapPage(
-                                    url=f"{self.TEST_BASE_URL}/atom_1_0_story_2.html",
+                                    url=f"{self.TEST_BASE_URL}/atom_1_0_story_{i}.html",
                                     news_story=SitemapNewsStory(
-                                        title="Test Atom 1.0 story #2",
+                                        title=f"Test Atom 1.0 story #{i}",
                                         publish_date=self.TEST_DATE_DATETIME,
                                     ),
-                                ),
+                                )
+                                for i in (1, 2)
                             ],
                         ),
                     ],
@@ -236,21 +216,19 @@ class TestTreeRssAtom(TreeTestBase):
 
         actual_sitemap_tree = sitemap_tree_for_homepage(homepage_url=self.TEST_BASE_URL)
 
-        expected_lines = str(expected_sitemap_tree).split()
-        actual_lines = str(actual_sitemap_tree).split()
-        diff = difflib.ndiff(expected_lines, actual_lines)
-        diff_str = "\n".join(diff)
-
-        assert expected_sitemap_tree == actual_sitemap_tree, diff_str
+        # The diff is only computed if the assertion fails
+        assert expected_sitemap_tree == actual_sitemap_tree, "\n".join(
+            difflib.ndiff(
+                str(expected_sitemap_tree).split(), str(actual_sitemap_tree).split()
+            )
+        )
 
-        assert len(list(actual_sitemap_tree.all_pages())) == 6
-        assert len(list(actual_sitemap_tree.all_sitemaps())) == 4
+        assert sum(1 for _ in actual_sitemap_tree.all_pages()) == 6
+        assert sum(1 for _ in actual_sitemap_tree.all_sitemaps()) == 4
 
     def test_sitemap_tree_for_homepage_rss_atom_empty(self, requests_mock):
         """Test sitemap_tree_for_homepage() with empty RSS 2.0 / Atom 0.3 / Atom 1.0 feeds."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -352,5 +330,5 @@ class TestTreeRssAtom(TreeTestBase):
 
         assert expected_sitemap_tree == actual_sitemap_tree
 
-        assert len(list(actual_sitemap_tree.all_pages())) == 0
-        assert len(list(actual_sitemap_tree.all_sitemaps())) == 4
+        assert sum(1 for _ in actual_sitemap_tree.all_pages()) == 0
+        assert sum(1 for _ in actual_sitemap_tree.all_sitemaps()) == 4
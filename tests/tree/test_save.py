@@ -34,7 +34,7 @@ class TestTreeSave(TreeTestBase):
             tree_loaded = pickle.load(f)
 
         assert tree_all_pages == list(tree_loaded.all_pages())
-        assert len(list(tree_loaded.all_sitemaps())) == 7
+        assert sum(1 for _ in tree_loaded.all_sitemaps()) == 7
 
     def test_tree_to_dict(self, tree):
         tree_d = tree.to_dict()
@@ -1,6 +1,8 @@
 import textwrap
 
+from tests.helpers import gzip
 from tests.tree.base import TreeTestBase
+from usp.fetch_parse import SitemapFetcher
 from usp.objects.sitemap import (
     InvalidSitemap,
 )
@@ -9,7 +11,6 @@ from usp.tree import sitemap_tree_for_homepage
 
 class TestTreeSecurity(TreeTestBase):
     def test_billion_laughs_attack(self, requests_mock, caplog):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
         requests_mock.get(
             self.TEST_BASE_URL + "/robots.txt",
             headers={"Content-Type": "text/plain"},
@@ -56,3 +57,41 @@ class TestTreeSecurity(TreeTestBase):
             "Sitemap contained unexpected non-standard XML DOCTYPE. Parsing not supported for security reasons."
             in caplog.text
         )
+
+    def test_gzip_bomb_truncated(self, requests_mock, caplog, mocker):
+        max_sitemap_size = 64 * 1024
+        mocker.patch.object(
+            SitemapFetcher, "_SitemapFetcher__MAX_SITEMAP_SIZE", max_sitemap_size
+        )
+
+        self.init_robots_txt(requests_mock, "/sitemap.xml.gz")
+
+        urls = "".join(
+            f"<url><loc>{self.TEST_BASE_URL}/page_{x}.html</loc></url>"
+            for x in range(2000)
+        )
+        gzipped_sitemap = gzip(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+        )
+        # Only the gunzipped sitemap is over the limit
+        assert len(gzipped_sitemap) < max_sitemap_size
+
+        requests_mock.get(
+            self.TEST_BASE_URL + "/sitemap.xml.gz",
+            headers={"Content-Type": "application/x-gzip"},
+            content=gzipped_sitemap,
+        )
+
+        tree = sitemap_tree_for_homepage(self.TEST_BASE_URL)
+
+        # Sitemap is truncated at the maximum size and parsed up to there
+        page_urls = [page.url for page in tree.all_pages()]
+        assert 0 < len(page_urls) < 2000
+        assert page_urls == [
+            f"{self.TEST_BASE_URL}/page_{x}.html" for x in range(len(page_urls))
+        ]
+        assert (
+            f"Gunzipped response for {self.TEST_BASE_URL}/sitemap.xml.gz exceeds maximum size of {max_sitemap_size} bytes, truncating"
+            in caplog.text
+        )
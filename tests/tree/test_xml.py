@@ -21,8 +21,6 @@ class TestTreeXML(TreeTestBase):
         this behavior, so we have to support this too.
         """
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -101,8 +99,6 @@ class TestTreeXML(TreeTestBase):
     def test_sitemap_tree_for_homepage_no_sitemap(self, requests_mock):
         """Test sitemap_tree_for_homepage() with no sitemaps listed in robots.txt."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -136,8 +132,6 @@ class TestTreeXML(TreeTestBase):
     def test_sitemap_tree_for_homepage_unpublished_sitemap(self, requests_mock):
         """Test sitemap_tree_for_homepage() with some sitemaps not published in robots.txt."""
 
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/",
             text="This is a homepage.",
@@ -12,8 +12,6 @@ from usp.tree import sitemap_tree_for_homepage
 
 class TestXMLExts(TreeTestBase):
     def test_xml_image(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/robots.txt",
             headers={"Content-Type": "text/plain"},
@@ -101,16 +99,11 @@ class TestXMLExts(TreeTestBase):
             ],
         )
 
-        print(tree.to_dict())
-        print(tree)
-
         assert tree == expected_sitemap_tree
 
 
 class TestXMLHrefLang(TreeTestBase):
     def test_hreflang(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/robots.txt",
             headers={"Content-Type": "text/plain"},
@@ -161,8 +154,6 @@ class TestXMLHrefLang(TreeTestBase):
         ]
 
     def test_missing_attrs(self, requests_mock):
-        requests_mock.add_matcher(TreeTestBase.fallback_to_404_not_found_matcher)
-
         requests_mock.get(
             self.TEST_BASE_URL + "/robots.txt",
             headers={"Content-Type": "text/plain"},
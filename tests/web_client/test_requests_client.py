@@ -14,7 +14,7 @@ from usp.web_client.requests_client import RequestsWebClient
 
 
 class TestRequestsClient:
-    TEST_BASE_URL = "http://test-ultimate-sitemap-parser.com"  # mocked by HTTPretty
+    TEST_BASE_URL = "http://test-ultimate-sitemap-parser.com"  # mocked by requests-mock
     TEST_CONTENT_TYPE = "text/html"
 
     @pytest.fixture
@@ -138,6 +138,30 @@ class TestRequestsClient:
         response_length = len(response.raw_data())
         assert response_length == max_length
 
+    def test_iter_data_max_response_data_length(self, client, requests_mock):
+        actual_length = 1024 * 1024
+        max_length = 1024 * 512 + 1
+
+        test_url = self.TEST_BASE_URL + "/huge_page.html"
+        test_content = "a" * actual_length
+
+        requests_mock.get(
+            test_url,
+            headers={"Content-Type": self.TEST_CONTENT_TYPE},
+            text=test_content,
+        )
+
+        client.set_max_response_data_length(max_length)
+
+        response = client.get(test_url)
+
+        assert response
+        assert isinstance(response, AbstractWebClientSuccessResponse)
+
+        chunks = list(response.iter_data(chunk_size=1024))
+        assert max(len(chunk) for chunk in chunks) == 1024
+        assert len(b"".join(chunks)) == max_length
+
     def test_error_page_log(self, client, requests_mock, caplog):
         caplog.set_level(logging.DEBUG)
         test_url = self.TEST_BASE_URL + "/error_page.html"
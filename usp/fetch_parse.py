@@ -12,6 +12,8 @@ import logging
 import re
 import xml.parsers.expat
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
 
 from .exceptions import SitemapException, SitemapXMLParsingException
@@ -23,7 +25,7 @@ from .helpers import (
     is_http_url,
     parse_iso8601_date,
     parse_rfc2822_date,
-    ungzipped_response_content,
+    ungzipped_response_chunks,
 )
 from .objects.page import (
     SITEMAP_PAGE_DEFAULT_PRIORITY,
@@ -51,7 +53,10 @@ from .web_client.abstract_client import (
     NoWebClientException,
     WebClientErrorResponse,
 )
-from .web_client.requests_client import RequestsWebClient
+from .web_client.requests_client import (
+    RequestsWebClient,
+    _ThreadLocalRequestsWebClient,
+)
 
 log = logging.getLogger(__name__)
 
@@ -80,6 +85,7 @@ class SitemapFetcher:
         "_quiet_404",
         "_recurse_callback",
         "_recurse_list_callback",
+        "_max_workers",
     ]
 
     def __init__(
@@ -91,16 +97,19 @@ class SitemapFetcher:
         quiet_404: bool = False,
         recurse_callback: RecurseCallbackType | None = None,
         recurse_list_callback: RecurseListCallbackType | None = None,
+        max_workers: int = 1,
     ):
         """
 
         :param url: URL of the sitemap to fetch and parse.
         :param recursion_level: current recursion level of parser
-        :param web_client: Web client to use. If ``None``, a :class:`~.RequestsWebClient` will be used.
+        :param web_client: Web client to use. If ``None``, a :class:`~.RequestsWebClient` will be used (one per thread
+            if ``max_workers`` is greater than 1).
         :param parent_urls: Set of parent URLs that led to this sitemap.
         :param quiet_404: Whether 404 errors are expected and should be logged at a reduced level, useful for speculative fetching of known URLs.
         :param recurse_callback: Optional callback to filter out a sub-sitemap. See :data:`~.RecurseCallbackType`.
         :param recurse_list_callback: Optional callback to filter the list of sub-sitemaps. See :data:`~.RecurseListCallbackType`.
+        :param max_workers: Maximum number of sub-sitemaps to fetch concurrently. See :func:`~.sitemap_tree_for_homepage`.
 
         :raises SitemapException: If the maximum recursion depth is exceeded.
         :raises SitemapException: If the URL is in the parent URLs set.
@@ -125,7 +134,10 @@ class SitemapFetcher:
             )
 
         if not web_client:
-            web_client = RequestsWebClient()
+            if max_workers > 1:
+                web_client = _ThreadLocalRequestsWebClient()
+            else:
+                web_client = RequestsWebClient()
 
         web_client.set_max_response_data_length(self.__MAX_SITEMAP_SIZE)
 
@@ -137,6 +149,7 @@ class SitemapFetcher:
 
         self._recurse_callback = recurse_callback
         self._recurse_list_callback = recurse_list_callback
+        self._max_workers = max_workers
 
     def _fetch(self) -> AbstractWebClientResponse:
         log.info(f"Fetching level {self._recursion_level} sitemap from {self._url}...")
@@ -172,48 +185,72 @@ class SitemapFetcher:
 
         self._url = response_url
 
-        response_content = ungzipped_response_content(
-            url=self._url,
-            response=response,
-            max_uncompressed_bytes=self.__MAX_SITEMAP_SIZE,
-        )
-
-        # MIME types returned in Content-Type are unpredictable, so peek into the content instead
-        if response_content[:20].strip().startswith("<"):
-            # XML sitemap (the specific kind is to be determined later)
-            parser = XMLSitemapParser(
+        # Errors reading the response might only surface while it's being parsed
+        response_chunks = _read_response_chunks(
+            ungzipped_response_chunks(
                 url=self._url,
-                content=response_content,
-                recursion_level=self._recursion_level,
-                web_client=self._web_client,
-                parent_urls=self._parent_urls,
-                recurse_callback=self._recurse_callback,
-                recurse_list_callback=self._recurse_list_callback,
+                response=response,
+                max_uncompressed_bytes=self.__MAX_SITEMAP_SIZE,
             )
+        )
 
-        else:
-            # Assume that it's some sort of a text file (robots.txt or plain text sitemap)
-            if self._url.endswith("/robots.txt"):
-                parser = IndexRobotsTxtSitemapParser(
+        try:
+            # MIME types returned in Content-Type are unpredictable, so peek into the content instead
+            response_start = ""
+            for chunk in response_chunks:
+                response_start += chunk
+                if len(response_start) >= 20:
+                    break
+            response_chunks = _chain_response_chunks(response_start, response_chunks)
+
+            if response_start[:20].strip().startswith("<"):
+                # XML sitemap (the specific kind is to be determined later), parsed as it's being read
+                parser = XMLSitemapParser(
                     url=self._url,
-                    content=response_content,
+                    content=response_chunks,
                     recursion_level=self._recursion_level,
                     web_client=self._web_client,
                     parent_urls=self._parent_urls,
                     recurse_callback=self._recurse_callback,
                     recurse_list_callback=self._recurse_list_callback,
+                    max_workers=self._max_workers,
                 )
+
             else:
-                parser = PlainTextSitemapParser(
-                    url=self._url,
-                    content=response_content,
-                    recursion_level=self._recursion_level,
-                    web_client=self._web_client,
-                    parent_urls=self._parent_urls,
-                )
+                # Assume that it's some sort of a text file (robots.txt or plain text sitemap)
+                response_content = "".join(response_chunks)
+
+                if self._url.endswith("/robots.txt"):
+                    parser = IndexRobotsTxtSitemapParser(
+                        url=self._url,
+                        content=response_content,
+                        recursion_level=self._recursion_level,
+                        web_client=self._web_client,
+                        parent_urls=self._parent_urls,
+                        recurse_callback=self._recurse_callback,
+                        recurse_list_callback=self._recurse_list_callback,
+                        max_workers=self._max_workers,
+                    )
+                else:
+                    parser = PlainTextSitemapParser(
+                        url=self._url,
+                        content=response_content,
+                        recursion_level=self._recursion_level,
+                        web_client=self._web_client,
+                        parent_urls=self._parent_urls,
+                    )
 
-        log.info(f"Parsing sitemap from URL {self._url}...")
-        sitemap = parser.sitemap()
+            log.info(f"Parsing sitemap from URL {self._url}...")
+            sitemap = parser.sitemap()
+
+        except _ResponseReadException as ex:
+            return InvalidSitemap(
+                url=self._url,
+                reason=f"Unable to fetch sitemap from {self._url}: {ex}",
+            )
+
+        finally:
+            response_chunks.close()
 
         return sitemap
 
@@ -243,6 +280,124 @@ class SitemapStrParser(SitemapFetcher):
         return LocalWebClientSuccessResponse(url=self._url, data=self._static_content)
 
 
+class _ResponseReadException(Exception):
+    """Error reading a response, as opposed to parsing it."""
+
+    pass
+
+
+def _read_response_chunks(response_chunks: Iterator[str]) -> Iterator[str]:
+    """
+    Yield the chunks of a response, re-raising any error reading them as :class:`_ResponseReadException`.
+
+    Closing the returned iterator closes ``response_chunks`` too.
+
+    :param response_chunks: Iterator which yields the response.
+    :return: Iterator which yields the same response.
+    """
+    try:
+        yield from response_chunks
+    except Exception as ex:
+        raise _ResponseReadException(str(ex)) from ex
+    finally:
+        if close := getattr(response_chunks, "close", None):
+            close()
+
+
+def _chain_response_chunks(
+    response_start: str, response_chunks: Iterator[str]
+) -> Iterator[str]:
+    """
+    Yield the start of a response that has already been read, and then the rest of it.
+
+    Unlike :func:`itertools.chain`, closing the returned iterator closes ``response_chunks`` too, releasing the
+    response they're being read from.
+
+    :param response_start: Start of the response which has already been read from ``response_chunks``.
+    :param response_chunks: Iterator which yields the rest of the response.
+    :return: Iterator which yields the whole response.
+    """
+    try:
+        yield response_start
+        yield from response_chunks
+    finally:
+        if close := getattr(response_chunks, "close", None):
+            close()
+
+
+def _fetch_sub_sitemaps(
+    sub_sitemap_urls: list[str],
+    recursion_level: int,
+    web_client: AbstractWebClient,
+    parent_urls: set[str],
+    recurse_callback: RecurseCallbackType,
+    recurse_list_callback: RecurseListCallbackType,
+    max_workers: int,
+) -> list[AbstractSitemap]:
+    """
+    Fetch and parse sub-sitemaps declared in an index sitemap.
+
+    If more than one sub-sitemap is to be fetched and ``max_workers`` is greater than 1, the sub-sitemaps are fetched
+    concurrently in a thread pool, and each of them then fetches its own sub-sitemaps one at a time. This way the
+    fetch fans out only once along any path of the tree, so no more than ``max_workers`` threads are ever used.
+
+    :param sub_sitemap_urls: URLs of sub-sitemaps declared in the index sitemap.
+    :param recursion_level: Recursion level of the index sitemap.
+    :param web_client: Web client to use for fetching sub-sitemaps.
+    :param parent_urls: Parent URLs of the sub-sitemaps, including the URL of the index sitemap.
+    :param recurse_callback: Callback to filter out a sub-sitemap. See :data:`~.RecurseCallbackType`.
+    :param recurse_list_callback: Callback to filter the list of sub-sitemaps. See :data:`~.RecurseListCallbackType`.
+    :param max_workers: Maximum number of sub-sitemaps to fetch concurrently.
+    :return: Fetched sub-sitemaps in the order they were declared in, excluding ones skipped by ``recurse_callback``.
+    """
+    filtered_sitemap_urls = list(
+        recurse_list_callback(sub_sitemap_urls, recursion_level, parent_urls)
+    )
+
+    fan_out = max_workers > 1 and len(filtered_sitemap_urls) > 1
+
+    def _fetch_sub_sitemap(sub_sitemap_url: str) -> AbstractSitemap | None:
+        # URL might be invalid, or recursion limit might have been reached
+        try:
+            if not recurse_callback(sub_sitemap_url, recursion_level, parent_urls):
+                return None
+
+            fetcher = SitemapFetcher(
+                url=sub_sitemap_url,
+                recursion_level=recursion_level + 1,
+                web_client=web_client,
+                parent_urls=parent_urls,
+                recurse_callback=recurse_callback,
+                recurse_list_callback=recurse_list_callback,
+                max_workers=1 if fan_out else max_workers,
+            )
+            return fetcher.sitemap()
+        except NoWebClientException:
+            return InvalidSitemap(
+                url=sub_sitemap_url, reason="Un-fetched child sitemap"
+            )
+        except Exception as ex:
+            return InvalidSitemap(
+                url=sub_sitemap_url,
+                reason=f"Unable to add sub-sitemap from URL {sub_sitemap_url}: {str(ex)}",
+            )
+
+    if fan_out:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(filtered_sitemap_urls))
+        ) as executor:
+            fetched_sitemaps = list(
+                executor.map(_fetch_sub_sitemap, filtered_sitemap_urls)
+            )
+    else:
+        fetched_sitemaps = [
+            _fetch_sub_sitemap(sub_sitemap_url)
+            for sub_sitemap_url in filtered_sitemap_urls
+        ]
+
+    return [sitemap for sitemap in fetched_sitemaps if sitemap is not None]
+
+
 class AbstractSitemapParser(metaclass=abc.ABCMeta):
     """Abstract robots.txt / XML / plain text sitemap parser."""
 
@@ -254,6 +409,7 @@ class AbstractSitemapParser(metaclass=abc.ABCMeta):
         "_parent_urls",
         "_recurse_callback",
         "_recurse_list_callback",
+        "_max_workers",
     ]
 
     def __init__(
@@ -265,12 +421,14 @@ class AbstractSitemapParser(metaclass=abc.ABCMeta):
         parent_urls: set[str],
         recurse_callback: RecurseCallbackType | None = None,
         recurse_list_callback: RecurseListCallbackType | None = None,
+        max_workers: int = 1,
     ):
         self._url = url
         self._content = content
         self._recursion_level = recursion_level
         self._web_client = web_client
         self._parent_urls = parent_urls
+        self._max_workers = max_workers
 
         if recurse_callback is None:  # Always allow child recursion
             self._recurse_callback = lambda url, level, parent_urls: True
@@ -295,6 +453,12 @@ class AbstractSitemapParser(metaclass=abc.ABCMeta):
 class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
     """robots.txt index sitemap parser."""
 
+    # robots.txt is supposed to be case sensitive but who cares in these Node.js times?
+    __SITEMAP_DIRECTIVE_REGEX = re.compile(
+        r"^\s*site-?map:\s*(\S.*?)\s*$", flags=re.IGNORECASE
+    )
+    """Regular expression to match a "Sitemap:" directive line, compiled once."""
+
     def __init__(
         self,
         url: str,
@@ -304,6 +468,7 @@ class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
         parent_urls: set[str],
         recurse_callback: RecurseCallbackType | None = None,
         recurse_list_callback: RecurseListCallbackType | None = None,
+        max_workers: int = 1,
     ):
         super().__init__(
             url=url,
@@ -313,6 +478,7 @@ class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
             parent_urls=parent_urls,
             recurse_callback=recurse_callback,
             recurse_list_callback=recurse_list_callback,
+            max_workers=max_workers,
         )
 
         if not self._url.endswith("/robots.txt"):
@@ -324,12 +490,10 @@ class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
         # Serves as an ordered set because we want to deduplicate URLs but also retain the order
         sitemap_urls = OrderedDict()
 
+        # Matching line by line is about twice as fast as a single finditer() over the whole body, which would need
+        # lookarounds at every position to recognize the same line boundaries as str.splitlines()
         for robots_txt_line in self._content.splitlines():
-            robots_txt_line = robots_txt_line.strip()
-            # robots.txt is supposed to be case sensitive but who cares in these Node.js times?
-            sitemap_match = re.search(
-                r"^site-?map:\s*(.+?)$", robots_txt_line, flags=re.IGNORECASE
-            )
+            sitemap_match = self.__SITEMAP_DIRECTIVE_REGEX.match(robots_txt_line)
             if sitemap_match:
                 sitemap_url = sitemap_match.group(1)
                 if is_http_url(sitemap_url):
@@ -339,38 +503,15 @@ class IndexRobotsTxtSitemapParser(AbstractSitemapParser):
                         f"Sitemap URL {sitemap_url} doesn't look like an URL, skipping"
                     )
 
-        sub_sitemaps = []
-        parent_urls = self._parent_urls | {self._url}
-
-        filtered_sitemap_urls = self._recurse_list_callback(
-            list(sitemap_urls.keys()), self._recursion_level, parent_urls
+        sub_sitemaps = _fetch_sub_sitemaps(
+            sub_sitemap_urls=list(sitemap_urls.keys()),
+            recursion_level=self._recursion_level,
+            web_client=self._web_client,
+            parent_urls=self._parent_urls | {self._url},
+            recurse_callback=self._recurse_callback,
+            recurse_list_callback=self._recurse_list_callback,
+            max_workers=self._max_workers,
         )
-        for sitemap_url in filtered_sitemap_urls:
-            try:
-                if self._recurse_callback(
-                    sitemap_url, self._recursion_level, parent_urls
-                ):
-                    fetcher = SitemapFetcher(
-                        url=sitemap_url,
-                        recursion_level=self._recursion_level + 1,
-                        web_client=self._web_client,
-                        parent_urls=parent_urls,
-                        recurse_callback=self._recurse_callback,
-                        recurse_list_callback=self._recurse_list_callback,
-                    )
-                    fetched_sitemap = fetcher.sitemap()
-                else:
-                    continue
-            except NoWebClientException:
-                fetched_sitemap = InvalidSitemap(
-                    url=sitemap_url, reason="Un-fetched child sitemap"
-                )
-            except Exception as ex:
-                fetched_sitemap = InvalidSitemap(
-                    url=sitemap_url,
-                    reason=f"Unable to add sub-sitemap from URL {sitemap_url}: {str(ex)}",
-                )
-            sub_sitemaps.append(fetched_sitemap)
 
         index_sitemap = IndexRobotsTxtSitemap(url=self._url, sub_sitemaps=sub_sitemaps)
 
@@ -411,21 +552,42 @@ class XMLSitemapParser(AbstractSitemapParser):
 
     __XML_NAMESPACE_SEPARATOR = " "
 
+    __NAMESPACE_PREFIXES = (
+        ("/sitemap/", "sitemap"),
+        ("/sitemap-news/", "news"),
+        ("/sitemap-image/", "image"),
+        ("/sitemap-video/", "video"),
+    )
+    """Namespace URL fragments and the internal prefixes that elements in them get."""
+
     __slots__ = [
         "_concrete_parser",
         "_is_non_ns_sitemap",
+        "_ns_element_names",
     ]
 
     def __init__(
         self,
         url: str,
-        content: str,
+        content: str | Iterable[str],
         recursion_level: int,
         web_client: AbstractWebClient,
         parent_urls: set[str],
         recurse_callback: RecurseCallbackType | None = None,
         recurse_list_callback: RecurseListCallbackType | None = None,
+        max_workers: int = 1,
     ):
+        """
+        :param url: URL of the sitemap.
+        :param content: Sitemap XML, either as a string or as an iterable of string chunks to be parsed as they
+            are being read.
+        :param recursion_level: Current recursion level of parser.
+        :param web_client: Web client to use for fetching sub-sitemaps.
+        :param parent_urls: Set of parent URLs that led to this sitemap.
+        :param recurse_callback: Optional callback to filter out a sub-sitemap. See :data:`~.RecurseCallbackType`.
+        :param recurse_list_callback: Optional callback to filter the list of sub-sitemaps. See :data:`~.RecurseListCallbackType`.
+        :param max_workers: Maximum number of sub-sitemaps to fetch concurrently.
+        """
         super().__init__(
             url=url,
             content=content,
@@ -434,12 +596,16 @@ class XMLSitemapParser(AbstractSitemapParser):
             parent_urls=parent_urls,
             recurse_callback=recurse_callback,
             recurse_list_callback=recurse_list_callback,
+            max_workers=max_workers,
         )
 
         # Will be initialized when the type of sitemap is known
         self._concrete_parser = None
         # Whether this is a malformed sitemap with no namespace
         self._is_non_ns_sitemap = False
+        # Normalized names of elements in one of the sitemap namespaces, which (unlike the rest) don't depend on
+        # what has been parsed before
+        self._ns_element_names = {}
 
     def sitemap(self) -> AbstractSitemap:
         parser = xml.parsers.expat.ParserCreate(
@@ -448,6 +614,9 @@ class XMLSitemapParser(AbstractSitemapParser):
         parser.StartElementHandler = self._xml_element_start
         parser.EndElementHandler = self._xml_element_end
         parser.CharacterDataHandler = self._xml_char_data
+        # Deliver contiguous text in as few handler calls as possible instead of splitting it at every newline and
+        # entity reference
+        parser.buffer_text = True
 
         def _xml_hardening_handler(handler: str):
             def _hardening_handler(*args, **kwargs):
@@ -461,13 +630,24 @@ class XMLSitemapParser(AbstractSitemapParser):
         parser.EntityDeclHandler = _xml_hardening_handler("ENTITY")
         parser.SetParamEntityParsing(xml.parsers.expat.XML_PARAM_ENTITY_PARSING_NEVER)
 
+        if isinstance(self._content, str):
+            content_chunks = [self._content]
+        else:
+            content_chunks = self._content
+
         try:
-            is_final = True
-            parser.Parse(self._content, is_final)
-        except Exception as ex:
+            for chunk in content_chunks:
+                parser.Parse(chunk, False)
+            parser.Parse("", True)
+        except (xml.parsers.expat.ExpatError, SitemapXMLParsingException) as ex:
             # Some sitemap XML files might end abruptly because webservers might be timing out on returning huge XML
-            # files so don't return InvalidSitemap() but try to get as much pages as possible
+            # files so don't return InvalidSitemap() but try to get as much pages as possible; errors reading the
+            # response itself are left for the fetcher to handle
             log.error(f"Parsing sitemap from URL {self._url} failed: {ex}")
+        finally:
+            # Release the response if parsing stopped before the end of it, before sub-sitemaps get fetched
+            if close := getattr(content_chunks, "close", None):
+                close()
 
         if not self._concrete_parser:
             return InvalidSitemap(
@@ -493,6 +673,11 @@ class XMLSitemapParser(AbstractSitemapParser):
         :return: Internal namespace name plus element name, e.g. "sitemap loc"
         """
 
+        # Same few elements get repeated for every URL
+        if normalized_name := self._ns_element_names.get(name):
+            return normalized_name
+
+        ns_name = name
         name_parts = name.split(self.__XML_NAMESPACE_SEPARATOR)
 
         if len(name_parts) == 1:
@@ -508,15 +693,13 @@ class XMLSitemapParser(AbstractSitemapParser):
                 f"Unable to determine namespace for element '{name}'"
             )
 
-        if "/sitemap/" in namespace_url:
-            name = f"sitemap:{name}"
-        elif "/sitemap-news/" in namespace_url:
-            name = f"news:{name}"
-        elif "/sitemap-image/" in namespace_url:
-            name = f"image:{name}"
-        elif "/sitemap-video/" in namespace_url:
-            name = f"video:{name}"
-        elif name in {"urlset", "sitemapindex"}:
+        for namespace_fragment, prefix in self.__NAMESPACE_PREFIXES:
+            if namespace_fragment in namespace_url:
+                normalized_name = f"{prefix}:{name}"
+                self._ns_element_names[ns_name] = normalized_name
+                return normalized_name
+
+        if name in {"urlset", "sitemapindex"}:
             # XML sitemap root tag but namespace is not set
             self._is_non_ns_sitemap = True
             log.warning(
@@ -556,6 +739,7 @@ class XMLSitemapParser(AbstractSitemapParser):
                     parent_urls=self._parent_urls,
                     recurse_callback=self._recurse_callback,
                     recurse_list_callback=self._recurse_list_callback,
+                    max_workers=self._max_workers,
                 )
 
             elif name == "rss":
@@ -684,9 +868,10 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
     __slots__ = [
         "_web_client",
         "_recursion_level",
-        # List of sub-sitemap URLs found in this index sitemap
+        # Sub-sitemap URLs found in this index sitemap (ordered set)
         "_sub_sitemap_urls",
         "_parent_urls",
+        "_max_workers",
     ]
 
     def __init__(
@@ -697,6 +882,7 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
         parent_urls: set[str],
         recurse_callback: RecurseCallbackType | None = None,
         recurse_list_callback: RecurseListCallbackType | None = None,
+        max_workers: int = 1,
     ):
         super().__init__(
             url=url,
@@ -706,8 +892,10 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
 
         self._web_client = web_client
         self._recursion_level = recursion_level
-        self._sub_sitemap_urls = []
+        # Serves as an ordered set because we want to deduplicate URLs but also retain the order
+        self._sub_sitemap_urls = OrderedDict()
         self._parent_urls = parent_urls
+        self._max_workers = max_workers
 
     def xml_element_end(self, name: str) -> None:
         if name == "sitemap:loc":
@@ -718,46 +906,20 @@ class IndexXMLSitemapParser(AbstractXMLSitemapParser):
                 )
 
             else:
-                if sub_sitemap_url not in self._sub_sitemap_urls:
-                    self._sub_sitemap_urls.append(sub_sitemap_url)
+                self._sub_sitemap_urls[sub_sitemap_url] = True
 
         super().xml_element_end(name=name)
 
     def sitemap(self) -> AbstractSitemap:
-        sub_sitemaps = []
-
-        parent_urls = self._parent_urls | {self._url}
-        filtered_sitemap_urls = self._recurse_list_callback(
-            list(self._sub_sitemap_urls), self._recursion_level, parent_urls
+        sub_sitemaps = _fetch_sub_sitemaps(
+            sub_sitemap_urls=list(self._sub_sitemap_urls.keys()),
+            recursion_level=self._recursion_level,
+            web_client=self._web_client,
+            parent_urls=self._parent_urls | {self._url},
+            recurse_callback=self._recurse_callback,
+            recurse_list_callback=self._recurse_list_callback,
+            max_workers=self._max_workers,
         )
-        for sub_sitemap_url in filtered_sitemap_urls:
-            # URL might be invalid, or recursion limit might have been reached
-            try:
-                if self._recurse_callback(
-                    sub_sitemap_url, self._recursion_level, parent_urls
-                ):
-                    fetcher = SitemapFetcher(
-                        url=sub_sitemap_url,
-                        recursion_level=self._recursion_level + 1,
-                        web_client=self._web_client,
-                        parent_urls=parent_urls,
-                        recurse_callback=self._recurse_callback,
-                        recurse_list_callback=self._recurse_list_callback,
-                    )
-                    fetched_sitemap = fetcher.sitemap()
-                else:
-                    continue
-            except NoWebClientException:
-                fetched_sitemap = InvalidSitemap(
-                    url=sub_sitemap_url, reason="Un-fetched child sitemap"
-                )
-            except Exception as ex:
-                fetched_sitemap = InvalidSitemap(
-                    url=sub_sitemap_url,
-                    reason=f"Unable to add sub-sitemap from URL {sub_sitemap_url}: {str(ex)}",
-                )
-
-            sub_sitemaps.append(fetched_sitemap)
 
         index_sitemap = IndexXMLSitemap(url=self._url, sub_sitemaps=sub_sitemaps)
 
@@ -837,8 +999,12 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
                 )
             )
 
-        def page(self) -> SitemapPage | None:
-            """Return constructed sitemap page if one has been completed, otherwise None."""
+        def page(self, shared_strings: dict[str, str]) -> SitemapPage | None:
+            """
+            Return constructed sitemap page if one has been completed, otherwise None.
+
+            :param shared_strings: Values repeated across pages of the sitemap, mapped to the instance to share.
+            """
 
             # Required
             url = html_unescape_strip(self.url)
@@ -882,11 +1048,20 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
             if news_publish_date:
                 news_publish_date = parse_iso8601_date(date_string=news_publish_date)
 
+            # Publication name, language and access are usually the same for every story in a sitemap, so pages
+            # share one instance of each value instead of holding a copy of their own
             news_publication_name = html_unescape_strip(self.news_publication_name)
+            news_publication_name = shared_strings.setdefault(
+                news_publication_name, news_publication_name
+            )
             news_publication_language = html_unescape_strip(
                 self.news_publication_language
             )
+            news_publication_language = shared_strings.setdefault(
+                news_publication_language, news_publication_language
+            )
             news_access = html_unescape_strip(self.news_access)
+            news_access = shared_strings.setdefault(news_access, news_access)
 
             news_genres = html_unescape_strip(self.news_genres)
             if news_genres:
@@ -946,7 +1121,39 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
                 alternates=alternates,
             )
 
-    __slots__ = ["_current_page", "_pages", "_page_urls", "_current_image"]
+    __CHAR_DATA_ELEMENTS = {
+        # Every entry must have <loc>
+        "sitemap:loc": (False, "url", True),
+        "sitemap:lastmod": (False, "last_modified", False),
+        "sitemap:changefreq": (False, "change_frequency", False),
+        "sitemap:priority": (False, "priority", False),
+        # news/publication/name
+        "news:name": (False, "news_publication_name", False),
+        # news/publication/language
+        "news:language": (False, "news_publication_language", False),
+        "news:publication_date": (False, "news_publish_date", False),
+        # Every Google News sitemap entry must have <title>
+        "news:title": (False, "news_title", True),
+        "news:access": (False, "news_access", False),
+        "news:keywords": (False, "news_keywords", False),
+        "news:stock_tickers": (False, "news_stock_tickers", False),
+        # Every image entry must have <loc>
+        "image:loc": (True, "loc", True),
+        "image:caption": (True, "caption", False),
+        "image:geo_location": (True, "geo_location", False),
+        "image:title": (True, "title", False),
+        "image:license": (True, "license", False),
+    }
+    """Elements whose character data is stored as-is, mapped to (whether it belongs to <image:image>, attribute of
+    :class:`Page` or :class:`Image` to store it in, whether character data is required)."""
+
+    __slots__ = [
+        "_current_page",
+        "_pages",
+        "_page_urls",
+        "_current_image",
+        "_shared_strings",
+    ]
 
     def __init__(self, url: str):
         super().__init__(url=url)
@@ -955,6 +1162,8 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
         self._pages = []
         self._page_urls = set()
         self._current_image = None
+        # Only lives as long as this parser, unlike a process-wide cache or interned strings
+        self._shared_strings = {}
 
     def xml_element_start(self, name: str, attrs: dict[str, str]) -> None:
         super().xml_element_start(name=name, attrs=attrs)
@@ -1009,69 +1218,17 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
         elif name == "image:image":
             self._current_page.images.append(self._current_image)
             self._current_image = None
-        else:
-            if name == "sitemap:loc":
-                # Every entry must have <loc>
+        elif element := self.__CHAR_DATA_ELEMENTS.get(name):
+            is_image_element, attribute, is_required = element
+            if is_required:
                 self.__require_last_char_data_to_be_set(name=name)
-                self._current_page.url = self._last_char_data
-
-            elif name == "sitemap:lastmod":
-                # Element might be present but character data might be empty
-                self._current_page.last_modified = self._last_char_data
-
-            elif name == "sitemap:changefreq":
-                # Element might be present but character data might be empty
-                self._current_page.change_frequency = self._last_char_data
-
-            elif name == "sitemap:priority":
-                # Element might be present but character data might be empty
-                self._current_page.priority = self._last_char_data
-
-            elif name == "news:name":  # news/publication/name
-                # Element might be present but character data might be empty
-                self._current_page.news_publication_name = self._last_char_data
 
-            elif name == "news:language":  # news/publication/language
-                # Element might be present but character data might be empty
-                self._current_page.news_publication_language = self._last_char_data
-
-            elif name == "news:publication_date":
-                # Element might be present but character data might be empty
-                self._current_page.news_publish_date = self._last_char_data
-
-            elif name == "news:title":
-                # Every Google News sitemap entry must have <title>
-                self.__require_last_char_data_to_be_set(name=name)
-                self._current_page.news_title = self._last_char_data
-
-            elif name == "news:access":
-                # Element might be present but character data might be empty
-                self._current_page.news_access = self._last_char_data
-
-            elif name == "news:keywords":
-                # Element might be present but character data might be empty
-                self._current_page.news_keywords = self._last_char_data
-
-            elif name == "news:stock_tickers":
-                # Element might be present but character data might be empty
-                self._current_page.news_stock_tickers = self._last_char_data
-
-            elif name == "image:loc":
-                # Every image entry must have <loc>
-                self.__require_last_char_data_to_be_set(name=name)
-                self._current_image.loc = self._last_char_data
-
-            elif name == "image:caption":
-                self._current_image.caption = self._last_char_data
-
-            elif name == "image:geo_location":
-                self._current_image.geo_location = self._last_char_data
-
-            elif name == "image:title":
-                self._current_image.title = self._last_char_data
-
-            elif name == "image:license":
-                self._current_image.license = self._last_char_data
+            # Optional elements might be present but their character data might be empty
+            setattr(
+                self._current_image if is_image_element else self._current_page,
+                attribute,
+                self._last_char_data,
+            )
 
         super().xml_element_end(name=name)
 
@@ -1079,7 +1236,7 @@ class PagesXMLSitemapParser(AbstractXMLSitemapParser):
         pages = []
 
         for page_row in self._pages:
-            page = page_row.page()
+            page = page_row.page(shared_strings=self._shared_strings)
             if page:
                 pages.append(page)
 
@@ -1,14 +1,18 @@
 """Helper utilities."""
 
+import codecs
 import datetime
+import functools
 import gzip as gzip_lib
 import html
 import io
+import itertools
 import logging
 import re
 import sys
 import time
-from collections.abc import Callable
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from http import HTTPStatus
 from typing import TypeAlias
 from urllib.parse import unquote_plus, urlparse, urlunparse
@@ -31,6 +35,20 @@ __URL_REGEX = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
 
 HAS_DATETIME_NEW_ISOPARSER = sys.version_info >= (3, 11)
 
+DATE_CACHE_SIZE = 4096
+"""Number of most recently parsed date strings to cache the results of."""
+
+RESPONSE_CHUNK_SIZE = 128 * 1024
+"""Size of chunks (in bytes) in which responses are read, gunzipped and decoded.
+
+Same as the read buffer size of the standard library's :mod:`gzip` module."""
+
+__GZIP_WBITS = zlib.MAX_WBITS | 16
+"""zlib window size setting which makes it expect a gzip header and trailer."""
+
+__GZIP_MAGIC = b"\x1f\x8b"
+"""Magic number which every gzip member starts with."""
+
 # TODO: Convert to TypeAlias when Python3.9 support is dropped.
 RecurseCallbackType: TypeAlias = Callable[[str, int, set[str]], bool]
 """Type for the callback function used to decide whether to recurse into a sitemap.
@@ -101,27 +119,33 @@ def html_unescape_strip(string: str | None) -> str | None:
     return string
 
 
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_iso8601_date(date_string: str) -> datetime.datetime | None:
     """
     Parse ISO 8601 date (e.g. from sitemap's <publication_date>) into datetime.datetime object.
 
+    Results are cached, as sitemaps often repeat the same date for many pages.
+
     :param date_string: ISO 8601 date, e.g. "2018-01-12T21:57:27Z" or "1997-07-16T19:20:30+01:00".
     :return: datetime.datetime object of a parsed date.
     """
-    # FIXME parse known date formats faster
-
     if not date_string:
         raise SitemapException("Date string is unset.")
 
     try:
-        if HAS_DATETIME_NEW_ISOPARSER:
-            # From Python 3.11, fromisosort is able to parse nearly any valid ISO 8601 string
-            return datetime.datetime.fromisoformat(date_string)
-        # Try the more efficient ISO 8601 parser
-        return dateutil_isoparse(date_string)
+        # Implemented in C, so much faster than dateutil; from Python 3.11, it is able to parse nearly any valid
+        # ISO 8601 string, and before that at least the most common "YYYY-MM-DD[THH:MM:SS[+HH:MM]]" ones
+        return datetime.datetime.fromisoformat(date_string)
     except ValueError:
         pass
 
+    if not HAS_DATETIME_NEW_ISOPARSER:
+        # Try the more efficient ISO 8601 parser
+        try:
+            return dateutil_isoparse(date_string)
+        except ValueError:
+            pass
+
     # Try the less efficient general parser
     try:
         return dateutil_parse(date_string)
@@ -129,10 +153,13 @@ def parse_iso8601_date(date_string: str) -> datetime.datetime | None:
         return None
 
 
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_rfc2822_date(date_string: str) -> datetime.datetime | None:
     """
     Parse RFC 2822 date (e.g. from Atom's <issued>) into datetime.datetime object.
 
+    Results are cached, as feeds often repeat the same date for many items.
+
     :param date_string: RFC 2822 date, e.g. "Tue, 10 Aug 2010 20:43:53 -0000".
     :return: datetime.datetime object of a parsed date.
     """
@@ -199,7 +226,7 @@ def __response_is_gzipped_data(
     url: str, response: AbstractWebClientSuccessResponse
 ) -> bool:
     """
-    Return True if Response looks like it's gzipped.
+    Return True if Response claims to be gzipped, by either its URL extension or its Content-Type.
 
     :param url: URL the response was fetched from.
     :param response: Response object.
@@ -220,6 +247,9 @@ def gunzip(data: bytes, max_output_bytes: int | None = None) -> bytes:
     """
     Gunzip data.
 
+    Sitemaps themselves are gunzipped incrementally by :func:`ungzipped_response_chunks`; this function is kept as
+    part of the public helpers API for gunzipping data that is already fully in memory.
+
     :raises GunzipException: If the data cannot be decompressed.
     :param data: Gzipped data.
     :return: Gunzipped data.
@@ -259,36 +289,162 @@ def gunzip(data: bytes, max_output_bytes: int | None = None) -> bytes:
     return gunzipped_data
 
 
-def ungzipped_response_content(
+def __gunzip_chunks(
+    url: str, chunks: Iterable[bytes], max_output_bytes: int | None = None
+) -> Iterator[bytes]:
+    """
+    Gunzip data chunks as they are being read.
+
+    If the data can't be gunzipped before anything gets decompressed from it, it is assumed to not be gzipped at
+    all and is passed through as-is.
+
+    If more than ``max_output_bytes`` would be decompressed, the output is truncated at that size and a warning is
+    logged, so that whatever fits can still be parsed.
+
+    :param url: URL the data was fetched from.
+    :param chunks: Gzipped data chunks.
+    :param max_output_bytes: Maximum number of bytes to decompress, or None to decompress everything.
+    :return: Iterator which yields gunzipped data chunks.
+    """
+    chunks = iter(chunks)
+    decompressor = zlib.decompressobj(wbits=__GZIP_WBITS)
+
+    # Chunks read so far, to be passed through if the data turns out to be not gzipped; None once decompression works
+    read_chunks = []
+    output_bytes = 0
+
+    for chunk in chunks:
+        if read_chunks is not None:
+            read_chunks.append(chunk)
+
+        try:
+            while chunk:
+                if decompressor.eof:
+                    # Whatever follows a complete gzip member is either zero padding, which gets skipped (same as the
+                    # gzip module does), or another gzip member
+                    chunk = chunk.lstrip(b"\0")
+                    if not chunk:
+                        break
+                    decompressor = zlib.decompressobj(wbits=__GZIP_WBITS)
+
+                # Limit the output of a single call so that decompression bombs don't get to allocate much
+                data = decompressor.decompress(chunk, RESPONSE_CHUNK_SIZE)
+                if decompressor.eof:
+                    chunk = decompressor.unused_data
+                else:
+                    chunk = decompressor.unconsumed_tail
+
+                if not data:
+                    continue
+
+                read_chunks = None
+                output_bytes += len(data)
+
+                if max_output_bytes is not None and output_bytes > max_output_bytes:
+                    log.warning(
+                        f"Gunzipped response for {url} exceeds maximum size of {max_output_bytes} bytes, truncating"
+                    )
+                    yield data[: len(data) - (output_bytes - max_output_bytes)]
+                    return
+
+                yield data
+
+        except zlib.error as ex:
+            if read_chunks is None:
+                log.warning(f"Unable to gunzip the rest of response for {url}: {ex}")
+                return
+
+            # In case of an error, just assume that it's one of the non-gzipped sitemaps with ".gz" extension
+            log.warning(
+                f"Unable to gunzip response for {url}, maybe it's a non-gzipped sitemap: {ex}"
+            )
+            yield from read_chunks
+            yield from chunks
+            return
+
+    if read_chunks is not None:
+        log.warning(
+            f"Unable to gunzip response for {url}, maybe it's a non-gzipped sitemap: no data could be decompressed"
+        )
+        yield from read_chunks
+
+    elif not decompressor.eof:
+        log.warning(f"Gzipped response for {url} ended abruptly")
+
+
+def ungzipped_response_chunks(
     url: str,
     response: AbstractWebClientSuccessResponse,
     max_uncompressed_bytes: int | None = None,
-) -> str:
+) -> Iterator[str]:
     """
-    Return HTTP response's decoded content, gunzip it if necessary.
+    Return iterator which yields HTTP response's decoded content in chunks, gunzipping it if necessary.
+
+    The response is read, gunzipped and decoded incrementally, so the whole of it never has to be held in memory.
+    Closing the returned iterator before it's exhausted closes the response's data iterator too.
 
     :param url: URL the response was fetched from.
     :param response: Response object.
-    :return: Decoded and (if necessary) gunzipped response string.
+    :param max_uncompressed_bytes: Maximum number of bytes to gunzip, or None to gunzip everything.
+    :return: Iterator which yields decoded and (if necessary) gunzipped response string chunks.
     """
 
-    data = response.raw_data()
+    data_chunks = iter(response.iter_data(RESPONSE_CHUNK_SIZE))
+    chunks = data_chunks
 
-    if __response_is_gzipped_data(url=url, response=response):
-        try:
-            data = gunzip(data, max_output_bytes=max_uncompressed_bytes)
-        except GunzipException as ex:
-            # In case of an error, just assume that it's one of the non-gzipped sitemaps with ".gz" extension
+    try:
+        # Content-Type and URL extension are unreliable, so check for the gzip magic number instead
+        data_start = b""
+        for chunk in chunks:
+            data_start += chunk
+            if len(data_start) >= len(__GZIP_MAGIC):
+                break
+        chunks = itertools.chain([data_start], chunks)
+
+        if data_start.startswith(__GZIP_MAGIC):
+            chunks = __gunzip_chunks(
+                url=url, chunks=chunks, max_output_bytes=max_uncompressed_bytes
+            )
+
+        elif __response_is_gzipped_data(url=url, response=response):
             log.warning(
-                f"Unable to gunzip response for {url}, maybe it's a non-gzipped sitemap: {ex}"
+                f"Unable to gunzip response for {url}, maybe it's a non-gzipped sitemap: no gzip magic number"
             )
 
-    # FIXME other encodings
-    data = data.decode("utf-8-sig", errors="replace")
+        # FIXME other encodings
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+
+        for chunk in chunks:
+            if data := decoder.decode(chunk):
+                yield data
 
-    assert isinstance(data, str)
+        if data := decoder.decode(b"", final=True):
+            yield data
+    finally:
+        # Release the response (e.g. return its connection to the pool) even if it wasn't read until the end
+        if close := getattr(data_chunks, "close", None):
+            close()
 
-    return data
+
+def ungzipped_response_content(
+    url: str,
+    response: AbstractWebClientSuccessResponse,
+    max_uncompressed_bytes: int | None = None,
+) -> str:
+    """
+    Return HTTP response's decoded content, gunzip it if necessary.
+
+    :param url: URL the response was fetched from.
+    :param response: Response object.
+    :param max_uncompressed_bytes: Maximum number of bytes to gunzip, or None to gunzip everything.
+    :return: Decoded and (if necessary) gunzipped response string.
+    """
+
+    return "".join(
+        ungzipped_response_chunks(
+            url=url, response=response, max_uncompressed_bytes=max_uncompressed_bytes
+        )
+    )
 
 
 def strip_url_to_homepage(url: str) -> str:
@@ -65,6 +65,9 @@ class SitemapNewsStory:
         if not isinstance(other, SitemapNewsStory):
             raise NotImplementedError
 
+        if self is other:
+            return True
+
         if self.title != other.title:
             return False
 
@@ -116,9 +119,10 @@ class SitemapNewsStory:
                 self.publication_name,
                 self.publication_language,
                 self.access,
-                self.genres,
-                self.keywords,
-                self.stock_tickers,
+                # Lists aren't hashable
+                tuple(self.genres),
+                tuple(self.keywords),
+                tuple(self.stock_tickers),
             )
         )
 
@@ -230,6 +234,9 @@ class SitemapImage:
         if not isinstance(other, SitemapImage):
             raise NotImplementedError
 
+        if self is other:
+            return True
+
         if self.loc != other.loc:
             return False
 
@@ -317,7 +324,11 @@ class SitemapPageChangeFrequency(Enum):
     @classmethod
     def has_value(cls, value: str) -> bool:
         """Test if enum has specified value."""
-        return any(value == item.value for item in cls)
+        return value in _CHANGE_FREQUENCY_VALUES
+
+
+_CHANGE_FREQUENCY_VALUES = frozenset(item.value for item in SitemapPageChangeFrequency)
+"""Values of all change frequencies, for checking whether a value is valid without going through each member."""
 
 
 class SitemapPage:
@@ -364,6 +375,9 @@ class SitemapPage:
         if not isinstance(other, SitemapPage):
             raise NotImplementedError
 
+        if self is other:
+            return True
+
         if self.url != other.url:
             return False
 
@@ -239,6 +239,10 @@ class AbstractPagesSitemap(AbstractSitemap, metaclass=abc.ABCMeta):
         if not isinstance(other, AbstractPagesSitemap):
             raise NotImplementedError
 
+        # Avoid loading the pages from disk (twice) to compare a sitemap with itself
+        if self is other:
+            return True
+
         if self.url != other.url:
             return False
 
@@ -299,13 +303,12 @@ class AbstractPagesSitemap(AbstractSitemap, metaclass=abc.ABCMeta):
         return []
 
 
-# TODO: declare empty __slots__
 class PagesXMLSitemap(AbstractPagesSitemap):
     """
     XML sitemap that contains URLs to pages.
     """
 
-    pass
+    __slots__ = []
 
 
 class PagesTextSitemap(AbstractPagesSitemap):
@@ -313,7 +316,7 @@ class PagesTextSitemap(AbstractPagesSitemap):
     Plain text sitemap that contains URLs to pages.
     """
 
-    pass
+    __slots__ = []
 
 
 class PagesRSSSitemap(AbstractPagesSitemap):
@@ -321,7 +324,7 @@ class PagesRSSSitemap(AbstractPagesSitemap):
     RSS 2.0 sitemap that contains URLs to pages.
     """
 
-    pass
+    __slots__ = []
 
 
 class PagesAtomSitemap(AbstractPagesSitemap):
@@ -329,7 +332,7 @@ class PagesAtomSitemap(AbstractPagesSitemap):
     RSS 0.3 / 1.0 sitemap that contains URLs to pages.
     """
 
-    pass
+    __slots__ = []
 
 
 class AbstractIndexSitemap(AbstractSitemap):
@@ -399,8 +402,15 @@ class AbstractIndexSitemap(AbstractSitemap):
 
         :return: Iterator which yields all pages of this sitemap and linked sitemaps (if any).
         """
-        for sub_sitemap in self.sub_sitemaps:
-            yield from sub_sitemap.all_pages()
+        # Walk the tree with an explicit stack instead of nesting generators, so that pages don't have to be passed
+        # up through a generator for every level of index sitemaps
+        stack = list(reversed(self.sub_sitemaps))
+        while stack:
+            sub_sitemap = stack.pop()
+            if isinstance(sub_sitemap, AbstractIndexSitemap):
+                stack.extend(reversed(sub_sitemap.sub_sitemaps))
+            else:
+                yield from sub_sitemap.all_pages()
 
     def all_sitemaps(self) -> Iterator["AbstractSitemap"]:
         """
@@ -408,9 +418,15 @@ class AbstractIndexSitemap(AbstractSitemap):
 
         :return: Iterator which yields all sub-sitemaps of this sitemap.
         """
-        for sub_sitemap in self.sub_sitemaps:
+        # Pre-order walk with an explicit stack, see all_pages()
+        stack = list(reversed(self.sub_sitemaps))
+        while stack:
+            sub_sitemap = stack.pop()
             yield sub_sitemap
-            yield from sub_sitemap.all_sitemaps()
+            if isinstance(sub_sitemap, AbstractIndexSitemap):
+                stack.extend(reversed(sub_sitemap.sub_sitemaps))
+            else:
+                yield from sub_sitemap.all_sitemaps()
 
 
 class IndexWebsiteSitemap(AbstractIndexSitemap):
@@ -418,7 +434,7 @@ class IndexWebsiteSitemap(AbstractIndexSitemap):
     Website's root sitemaps, including robots.txt and extra ones.
     """
 
-    pass
+    __slots__ = []
 
 
 class IndexXMLSitemap(AbstractIndexSitemap):
@@ -426,7 +442,7 @@ class IndexXMLSitemap(AbstractIndexSitemap):
     XML sitemap with URLs to other sitemaps.
     """
 
-    pass
+    __slots__ = []
 
 
 class IndexRobotsTxtSitemap(AbstractIndexSitemap):
@@ -434,4 +450,4 @@ class IndexRobotsTxtSitemap(AbstractIndexSitemap):
     robots.txt sitemap with URLs to other sitemaps.
     """
 
-    pass
+    __slots__ = []
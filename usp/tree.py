@@ -1,6 +1,7 @@
 """Helpers to generate a sitemap tree."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from .exceptions import SitemapException
 from .fetch_parse import SitemapFetcher, SitemapStrParser
@@ -17,6 +18,10 @@ from .objects.sitemap import (
     InvalidSitemap,
 )
 from .web_client.abstract_client import AbstractWebClient
+from .web_client.requests_client import (
+    RequestsWebClient,
+    _ThreadLocalRequestsWebClient,
+)
 
 log = logging.getLogger(__name__)
 
@@ -48,13 +53,16 @@ def sitemap_tree_for_homepage(
     recurse_callback: RecurseCallbackType | None = None,
     recurse_list_callback: RecurseListCallbackType | None = None,
     normalize_homepage_url: bool = True,
+    max_workers: int = 1,
 ) -> AbstractSitemap:
     """
     Using a homepage URL, fetch the tree of sitemaps and pages listed in them.
 
     :param homepage_url: Homepage URL of a website to fetch the sitemap tree for, e.g. "http://www.example.com/".
     :param web_client: Custom web client implementation to use when fetching sitemaps.
-        If ``None``, a :class:`~.RequestsWebClient` will be used.
+        If ``None``, a single :class:`~.RequestsWebClient` will be created and used for all fetches, so that its
+        connections are reused. If ``max_workers`` is greater than 1, each worker thread gets its own
+        :class:`~.RequestsWebClient` instead, as ``requests.Session`` is not documented to be thread-safe.
     :param use_robots: Whether to discover sitemaps through robots.txt.
     :param use_known_paths: Whether to discover sitemaps through common known paths.
     :param extra_known_paths: Extra paths to check for sitemaps.
@@ -63,6 +71,10 @@ def sitemap_tree_for_homepage(
     :param normalize_homepage_url: Whether to normalize the provided homepage URL to the domain root (default: True),
         e.g. "http://www.example.com/xxx/yyy/" -> "http://www.example.com/".
         Disabling this may prevent sitemap discovery via robots.txt, as robots.txt is typically only available at the domain root.
+    :param max_workers: Maximum number of sitemaps to fetch concurrently (default: 1, fetch one at a time).
+        Applies to the sub-sitemaps of index sitemaps and to probing of known paths.
+        If this is greater than 1, a custom ``web_client`` is shared by all worker threads, so it and any callbacks
+        must be thread-safe.
 
     :return: Root sitemap object of the fetched sitemap tree.
     """
@@ -70,8 +82,19 @@ def sitemap_tree_for_homepage(
     if not is_http_url(homepage_url):
         raise SitemapException(f"URL {homepage_url} is not a HTTP(s) URL.")
 
+    if max_workers < 1:
+        raise SitemapException(f"max_workers must be at least 1, got {max_workers}.")
+
     extra_known_paths = extra_known_paths or set()
 
+    if not web_client:
+        # Share one client (and so one session's connection pool) between all fetches instead of each fetcher
+        # creating its own; sessions aren't thread-safe, so concurrent fetches get one client per thread
+        if max_workers > 1:
+            web_client = _ThreadLocalRequestsWebClient()
+        else:
+            web_client = RequestsWebClient()
+
     if normalize_homepage_url:
         stripped_homepage_url = strip_url_to_homepage(url=homepage_url)
         if homepage_url != stripped_homepage_url:
@@ -95,6 +118,7 @@ def sitemap_tree_for_homepage(
             parent_urls=set(),
             recurse_callback=recurse_callback,
             recurse_list_callback=recurse_list_callback,
+            max_workers=max_workers,
         )
         robots_txt_sitemap = robots_txt_fetcher.sitemap()
         if not isinstance(robots_txt_sitemap, InvalidSitemap):
@@ -105,25 +129,48 @@ def sitemap_tree_for_homepage(
                 sitemap_urls_found_in_robots_txt.add(sub_sitemap.url)
 
     if use_known_paths:
+        unpublished_sitemap_urls = []
         for unpublished_sitemap_path in _UNPUBLISHED_SITEMAP_PATHS | extra_known_paths:
             unpublished_sitemap_url = homepage_url + unpublished_sitemap_path
 
             # Don't refetch URLs already found in robots.txt
             if unpublished_sitemap_url not in sitemap_urls_found_in_robots_txt:
-                unpublished_sitemap_fetcher = SitemapFetcher(
-                    url=unpublished_sitemap_url,
-                    web_client=web_client,
-                    recursion_level=0,
-                    parent_urls=sitemap_urls_found_in_robots_txt,
-                    quiet_404=True,
-                    recurse_callback=recurse_callback,
-                    recurse_list_callback=recurse_list_callback,
+                unpublished_sitemap_urls.append(unpublished_sitemap_url)
+
+        # Probe the known paths concurrently if allowed, in which case each of them fetches its sub-sitemaps one
+        # at a time
+        fan_out = max_workers > 1 and len(unpublished_sitemap_urls) > 1
+
+        def _fetch_unpublished_sitemap(unpublished_sitemap_url: str) -> AbstractSitemap:
+            unpublished_sitemap_fetcher = SitemapFetcher(
+                url=unpublished_sitemap_url,
+                web_client=web_client,
+                recursion_level=0,
+                parent_urls=sitemap_urls_found_in_robots_txt,
+                quiet_404=True,
+                recurse_callback=recurse_callback,
+                recurse_list_callback=recurse_list_callback,
+                max_workers=1 if fan_out else max_workers,
+            )
+            return unpublished_sitemap_fetcher.sitemap()
+
+        if fan_out:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(unpublished_sitemap_urls))
+            ) as executor:
+                unpublished_sitemaps = list(
+                    executor.map(_fetch_unpublished_sitemap, unpublished_sitemap_urls)
                 )
-                unpublished_sitemap = unpublished_sitemap_fetcher.sitemap()
-
-                # Skip the ones that weren't found
-                if not isinstance(unpublished_sitemap, InvalidSitemap):
-                    sitemaps.append(unpublished_sitemap)
+        else:
+            unpublished_sitemaps = [
+                _fetch_unpublished_sitemap(unpublished_sitemap_url)
+                for unpublished_sitemap_url in unpublished_sitemap_urls
+            ]
+
+        for unpublished_sitemap in unpublished_sitemaps:
+            # Skip the ones that weren't found
+            if not isinstance(unpublished_sitemap, InvalidSitemap):
+                sitemaps.append(unpublished_sitemap)
 
     index_sitemap = IndexWebsiteSitemap(url=homepage_url, sub_sitemaps=sitemaps)
 
@@ -3,6 +3,7 @@
 import abc
 import random
 import time
+from collections.abc import Iterator
 from http import HTTPStatus
 
 RETRYABLE_HTTP_STATUS_CODES = {
@@ -100,6 +101,18 @@ class AbstractWebClientSuccessResponse(
         """
         raise NotImplementedError("Abstract method.")
 
+    def iter_data(self, chunk_size: int) -> Iterator[bytes]:
+        """
+        Return iterator which yields encoded raw data of the response in chunks.
+
+        The default implementation yields the whole of :meth:`raw_data` at once; web clients which are able to
+        stream responses should override it so that the response doesn't have to be held in memory in full.
+
+        :param chunk_size: Preferred size of each chunk, in bytes.
+        :return: Iterator which yields encoded raw data of the response.
+        """
+        yield self.raw_data()
+
     @abc.abstractmethod
     def url(self) -> str:
         """
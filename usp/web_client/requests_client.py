@@ -1,6 +1,8 @@
 """Implementation of :mod:`usp.web_client.abstract_client` with Requests."""
 
 import logging
+import threading
+from collections.abc import Iterator
 from http import HTTPStatus
 
 import requests
@@ -61,6 +63,23 @@ class RequestsWebClientSuccessResponse(AbstractWebClientSuccessResponse):
 
         return data
 
+    def iter_data(self, chunk_size: int) -> Iterator[bytes]:
+        data_length = 0
+        try:
+            for chunk in self.__requests_response.iter_content(chunk_size=chunk_size):
+                if (
+                    self.__max_response_data_length
+                    and data_length + len(chunk) >= self.__max_response_data_length
+                ):
+                    yield chunk[: self.__max_response_data_length - data_length]
+                    break
+
+                data_length += len(chunk)
+                yield chunk
+        finally:
+            # Release the connection even if the body wasn't (or won't be) read until the end
+            self.__requests_response.close()
+
     def url(self) -> str:
         return self.__requests_response.url
 
@@ -174,3 +193,31 @@ class RequestsWebClient(AbstractWebClient):
                     return RequestsWebClientErrorResponse(
                         message=message, retryable=False
                     )
+
+
+class _ThreadLocalRequestsWebClient(AbstractWebClient):
+    """
+    requests-based web client which uses a separate :class:`RequestsWebClient` in each thread.
+
+    ``requests.Session`` is not documented to be thread-safe, so this is the default web client when sitemaps are
+    fetched concurrently; connections are still reused between the requests made by each thread.
+    """
+
+    __slots__ = [
+        "__max_response_data_length",
+        "__local",
+    ]
+
+    def __init__(self):
+        self.__max_response_data_length = None
+        self.__local = threading.local()
+
+    def set_max_response_data_length(self, max_response_data_length: int) -> None:
+        self.__max_response_data_length = max_response_data_length
+
+    def get(self, url: str) -> AbstractWebClientResponse:
+        web_client = getattr(self.__local, "web_client", None)
+        if web_client is None:
+            web_client = self.__local.web_client = RequestsWebClient()
+        web_client.set_max_response_data_length(self.__max_response_data_length)
+        return web_client.get(url)